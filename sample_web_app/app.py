@@ -2,25 +2,23 @@ import os
 import uuid
 import logging
 from flask import Flask, render_template, request, jsonify
+from werkzeug.exceptions import HTTPException
 
-from config import Config
-from run_job import run_translation_job
+from config import CONFIG
+from tasks import translation_queue, trigger_translation_job
+from job_store import save_job, get_job, get_jobs, job_exists
+from gcs_utils import upload_stream_to_gcs
 
 app = Flask(__name__, template_folder='templates')
 
 app.secret_key = os.urandom(24)
-app.config['UPLOAD_FOLDER'] = Config.UPLOAD_FOLDER
+app.config['UPLOAD_FOLDER'] = CONFIG.UPLOAD_FOLDER
+app.config['MAX_CONTENT_LENGTH'] = CONFIG.MAX_CONTENT_LENGTH
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# In-memory store for job statuses. 
-# NOTE: This is not suitable for production. In a real-world application, 
-# you would use a persistent database (e.g., Redis, Firestore, or a relational DB)
-# to store job state.
-translation_jobs = {}
-
 @app.route('/')
 def index():
     """Render the main translation form."""
@@ -49,23 +47,20 @@ def translate():
     entity_file = request.files.get('entity_file')
     style_file = request.files.get('style_file')
 
-    if entity_file and entity_file.filename:
-        entity_content = entity_file.read().decode('utf-8')
-
-    if style_file and style_file.filename:
-        style_content = style_file.read().decode('utf-8')
+    # Instruction files previously sent to /upload are referenced by URI
+    entity_gcs_uri = request.form.get('entity_instructions_gcs')
+    style_gcs_uri = request.form.get('style_instructions_gcs')
 
-    session_id = str(uuid.uuid4()).replace('-', '')
+    session_id = uuid.uuid4().hex
     gcs_folder = f"translations/{session_id}"
     
     # Initialize job status
-    translation_jobs[session_id] = {
-        'status': 'initializing', 
-        'gcs_bucket': gcs_bucket, 
-        'gcs_folder': gcs_folder,
-        'operation_name': None,
-        'error': None
-    }
+    save_job(
+        session_id,
+        status='initializing',
+        gcs_bucket=gcs_bucket,
+        gcs_folder=gcs_folder,
+    )
 
     # --- Prepare arguments for Cloud Run Job ---
     job_args = [
@@ -78,40 +73,61 @@ def translate():
         job_args.extend(["--max-chunk-size", str(max_chunk_size)])
     if max_number_of_chunks:
         job_args.extend(["--max-number-of-chunks", str(max_number_of_chunks)])
-    if entity_content:
-        job_args.extend(["--entity-instructions", entity_content])
-    if style_content:
-        job_args.extend(["--style-instructions", style_content])
 
     try:
-        logger.info(f"Triggering Cloud Run job for session: {session_id}")
+        # Uploaded files are streamed straight to GCS and passed to the job by URI,
+        # keeping them out of the web app's memory and the container's argv.
+        if entity_gcs_uri:
+            job_args.extend(["--entity-instructions-gcs", entity_gcs_uri])
+        elif entity_file and entity_file.filename:
+            entity_uri = upload_stream_to_gcs(
+                entity_file.stream, gcs_bucket, f"{gcs_folder}/uploads/entity_instructions.txt"
+            )
+            job_args.extend(["--entity-instructions-gcs", entity_uri])
+        elif entity_content:
+            job_args.extend(["--entity-instructions", entity_content])
+
+        if style_gcs_uri:
+            job_args.extend(["--style-instructions-gcs", style_gcs_uri])
+        elif style_file and style_file.filename:
+            style_uri = upload_stream_to_gcs(
+                style_file.stream, gcs_bucket, f"{gcs_folder}/uploads/style_instructions.txt"
+            )
+            job_args.extend(["--style-instructions-gcs", style_uri])
+        elif style_content:
+            job_args.extend(["--style-instructions", style_content])
+
         logger.info(f"Job arguments: {job_args}")
+
+        if translation_queue is None:
+            logger.info(f"Triggering Cloud Run job for session: {session_id}")
+            operation_name = trigger_translation_job(session_id, job_args)
+
+            return jsonify({
+                "message": "Translation pipeline started successfully.",
+                "session_id": session_id,
+                "output_location": f"gs://{gcs_bucket}/{gcs_folder}",
+                "operation_name": operation_name
+            }), 200
+
+        logger.info(f"Queueing Cloud Run job for session: {session_id}")
         
-        # Execute the Cloud Run job
-        operation = run_translation_job(overrides={"args": job_args})
-        
-        # Store operation details
-        operation_name = operation.name if hasattr(operation, 'name') else str(operation)
-        translation_jobs[session_id]['operation_name'] = operation_name
-        translation_jobs[session_id]['status'] = 'running'
-        
-        logger.info(f"Job successfully triggered for session {session_id}")
-        logger.info(f"Operation name: {operation_name}")
+        # The Cloud Run API call happens in an RQ worker, which updates the job state
+        save_job(session_id, status='queued')
+        translation_queue.enqueue(trigger_translation_job, session_id, job_args)
         
         return jsonify({
-            "message": "Translation pipeline started successfully.",
+            "message": "Translation pipeline queued successfully.",
             "session_id": session_id,
             "output_location": f"gs://{gcs_bucket}/{gcs_folder}",
-            "operation_name": operation_name
-        }), 200
+        }), 202
         
     except Exception as e:
         error_msg = str(e)
-        logger.error(f"Failed to trigger Cloud Run job for session {session_id}: {error_msg}", exc_info=True)
+        logger.error(f"Failed to queue Cloud Run job for session {session_id}: {error_msg}", exc_info=True)
         
         # Update job status with detailed error
-        translation_jobs[session_id]['status'] = 'failed'
-        translation_jobs[session_id]['error'] = error_msg
+        save_job(session_id, status='failed', error=error_msg)
         
         return jsonify({
             "error": "Failed to start the translation job.",
@@ -120,14 +136,48 @@ def translate():
         }), 500
 
 
-@app.route('/status/<session_id>', methods=['GET'])
-def get_status(session_id):
-    """Check the status of a translation job."""
-    if session_id not in translation_jobs:
-        return jsonify({"error": "Session not found"}), 404
-    
-    job_info = translation_jobs[session_id]
-    return jsonify({
+UPLOAD_KINDS = ('entity', 'style')
+
+
+@app.route('/upload/<kind>', methods=['POST', 'PUT'])
+def upload_instructions(kind):
+    """
+    Stream a raw instruction file straight into GCS.
+
+    The body is sent as application/octet-stream and piped from the request
+    stream to the blob, bypassing Werkzeug's multipart parser. The returned
+    URI can be passed to /translate as `<kind>_instructions_gcs`.
+    """
+    if kind not in UPLOAD_KINDS:
+        return jsonify({"error": f"Unknown upload kind '{kind}'."}), 404
+
+    if request.mimetype != 'application/octet-stream':
+        return jsonify({"error": "Content-Type must be application/octet-stream."}), 415
+
+    gcs_bucket = request.args.get('gcs_bucket')
+    if not gcs_bucket:
+        return jsonify({"error": "GCS Bucket is required."}), 400
+
+    blob_name = f"uploads/{uuid.uuid4().hex}/{kind}_instructions.txt"
+    try:
+        gcs_uri = upload_stream_to_gcs(request.stream, gcs_bucket, blob_name)
+    except HTTPException:
+        # e.g. RequestEntityTooLarge raised while reading the stream (413)
+        raise
+    except Exception as e:
+        logger.error(f"Failed to upload {kind} instructions: {e}", exc_info=True)
+        return jsonify({"error": "Failed to upload file.", "details": str(e)}), 500
+
+    return jsonify({"gcs_uri": gcs_uri}), 201
+
+
+# Upper bound on session ids accepted by a single batched /status request
+MAX_STATUS_BATCH = 100
+
+
+def _status_payload(session_id, job_info):
+    """Build the public status representation of a stored job."""
+    return {
         "session_id": session_id,
         "status": job_info['status'],
         "gcs_bucket": job_info.get('gcs_bucket'),
@@ -135,6 +185,37 @@ def get_status(session_id):
         "operation_name": job_info.get('operation_name'),
         "error": job_info.get('error'),
         "output_location": f"gs://{job_info['gcs_bucket']}/{job_info['gcs_folder']}" if job_info.get('gcs_bucket') and job_info.get('gcs_folder') else None
+    }
+
+
+@app.route('/status/<session_id>', methods=['GET'])
+def get_status(session_id):
+    """Check the status of a translation job."""
+    job_info = get_job(session_id)
+    if job_info is None:
+        return jsonify({"error": "Session not found"}), 404
+    
+    return jsonify(_status_payload(session_id, job_info))
+
+
+@app.route('/status', methods=['GET'])
+def get_statuses():
+    """
+    Check the status of several translation jobs at once.
+
+    Takes a comma-separated `ids` query parameter and returns the job states
+    keyed by session_id, with null for unknown sessions.
+    """
+    session_ids = [i for i in request.args.get('ids', '').split(',') if i]
+    if not session_ids:
+        return jsonify({"error": "The ids query parameter is required."}), 400
+    if len(session_ids) > MAX_STATUS_BATCH:
+        return jsonify({"error": f"At most {MAX_STATUS_BATCH} ids can be requested at once."}), 400
+
+    jobs = get_jobs(session_ids)
+    return jsonify({
+        session_id: _status_payload(session_id, job_info) if job_info else None
+        for session_id, job_info in jobs.items()
     })
 
 
@@ -149,16 +230,22 @@ def job_callback():
     status = data.get('status')  # 'completed' or 'failed'
     error = data.get('error')
     
-    if not session_id or session_id not in translation_jobs:
+    if not session_id or not job_exists(session_id):
         return jsonify({"error": "Invalid session_id"}), 400
     
-    translation_jobs[session_id]['status'] = status
-    if error:
-        translation_jobs[session_id]['error'] = error
+    save_job(session_id, status=status, error=error or None)
     
     logger.info(f"Job callback received for session {session_id}: status={status}")
     return jsonify({"message": "Status updated"}), 200
 
 
 if __name__ == '__main__':
+    # Werkzeug's development server, for local debugging only; deployments
+    # run under gunicorn (see Dockerfile)
+    if not os.environ.get('FLASK_DEV'):
+        raise SystemExit(
+            "Run the app with gunicorn, e.g. "
+            "`gunicorn -k gthread -w $(nproc) --threads 8 --bind 0.0.0.0:5001 app:app`, "
+            "or set FLASK_DEV=1 to use the development server."
+        )
     app.run(debug=True, port=5001)
\ No newline at end of file
@@ -1,13 +1,62 @@
 import os
+from dataclasses import dataclass
+from typing import Optional
 
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    # Use os.environ.get to read variables injected by Cloud Run
-    GCP_PROJECT_ID = os.environ.get("GCP_PROJECT_ID")
-    GCP_REGION = os.environ.get("GCP_REGION", "us-central1")
-    CLOUD_RUN_JOB_NAME = os.environ.get("CLOUD_RUN_JOB_NAME", "translation-job")
-    UPLOAD_FOLDER = os.environ.get("UPLOAD_FOLDER", "/tmp/translation_uploads")
-
-    # Validation (Optional but recommended)
-    if not GCP_PROJECT_ID:
+    """
+    Application settings, read from the environment once at import.
+
+    The instance is immutable, so every thread and worker can share it without
+    locking; the required GCP settings are validated on creation.
+    """
+    GCP_PROJECT_ID: Optional[str]
+    GCP_REGION: str
+    CLOUD_RUN_JOB_NAME: str
+    UPLOAD_FOLDER: str
+    # Requests larger than this are rejected with 413 before any body is read.
+    MAX_CONTENT_LENGTH: int
+
+    # Job state store shared by all workers (e.g. a Memorystore instance).
+    # When unset, job state falls back to an in-process cache (development only).
+    REDIS_URL: Optional[str]
+    REDIS_MAX_CONNECTIONS: int
+    JOB_TTL_SECONDS: int
+    MAX_IN_MEMORY_JOBS: int
+    RQ_QUEUE_NAME: str
+    # Set once an `rq worker` consumes RQ_QUEUE_NAME (see deploy_to_cloud_run.sh);
+    # until then /translate triggers the Cloud Run job within the request.
+    RQ_WORKER_ENABLED: bool
+
+    def __post_init__(self):
         # This prevents the app from starting if critical config is missing
-        raise ValueError("No GCP_PROJECT_ID set for Flask application")
\ No newline at end of file
+        if not self.GCP_PROJECT_ID:
+            raise ValueError("No GCP_PROJECT_ID set for Flask application")
+        if self.RQ_WORKER_ENABLED and not self.REDIS_URL:
+            raise ValueError("RQ_WORKER_ENABLED requires REDIS_URL")
+        if not all([self.GCP_REGION, self.CLOUD_RUN_JOB_NAME]):
+            raise ValueError(
+                f"Missing required GCP configuration. "
+                f"REGION: {self.GCP_REGION}, JOB_NAME: {self.CLOUD_RUN_JOB_NAME}"
+            )
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build the settings from variables injected by Cloud Run."""
+        return cls(
+            GCP_PROJECT_ID=os.environ.get("GCP_PROJECT_ID"),
+            GCP_REGION=os.environ.get("GCP_REGION", "us-central1"),
+            CLOUD_RUN_JOB_NAME=os.environ.get("CLOUD_RUN_JOB_NAME", "translation-job"),
+            UPLOAD_FOLDER=os.environ.get("UPLOAD_FOLDER", "/tmp/translation_uploads"),
+            MAX_CONTENT_LENGTH=int(os.environ.get("MAX_CONTENT_LENGTH", str(100 * 1024 * 1024))),
+            REDIS_URL=os.environ.get("REDIS_URL"),
+            REDIS_MAX_CONNECTIONS=int(os.environ.get("REDIS_MAX_CONNECTIONS", "20")),
+            JOB_TTL_SECONDS=int(os.environ.get("JOB_TTL_SECONDS", "86400")),
+            MAX_IN_MEMORY_JOBS=int(os.environ.get("MAX_IN_MEMORY_JOBS", "10000")),
+            RQ_QUEUE_NAME=os.environ.get("RQ_QUEUE_NAME", "translation-jobs"),
+            RQ_WORKER_ENABLED=os.environ.get("RQ_WORKER_ENABLED", "").lower() in ("1", "true", "yes"),
+        )
+
+
+CONFIG = Config.from_env()
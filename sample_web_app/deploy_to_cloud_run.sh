@@ -29,6 +29,15 @@ fi
 REPO="translation-app-repo"
 IMAGE_NAME="translation-app-image"
 JOB_NAME="${CLOUD_RUN_JOB_NAME:-translation-job}"
+REDIS_URL="${REDIS_URL:-}"
+# Queue job triggers through RQ; requires REDIS_URL and deploys a worker pool below
+RQ_WORKER_ENABLED="${RQ_WORKER_ENABLED:-false}"
+RQ_QUEUE_NAME="${RQ_QUEUE_NAME:-translation-jobs}"
+
+if [ "$RQ_WORKER_ENABLED" = "true" ] && [ -z "$REDIS_URL" ]; then
+    echo "Error: RQ_WORKER_ENABLED=true requires REDIS_URL in .env file."
+    exit 1
+fi
 
 gcloud artifacts repositories create ${REPO} \
     --project=${PROJECT_ID} \
@@ -47,4 +56,16 @@ gcloud run deploy translation-app-service \
     --region=${REGION} \
     --allow-unauthenticated \
     --timeout=3600s \
-    --set-env-vars="GCP_PROJECT_ID=$PROJECT_ID,GCP_REGION=$REGION,CLOUD_RUN_JOB_NAME=$JOB_NAME"
+    --set-env-vars="GCP_PROJECT_ID=$PROJECT_ID,GCP_REGION=$REGION,CLOUD_RUN_JOB_NAME=$JOB_NAME,REDIS_URL=$REDIS_URL,RQ_QUEUE_NAME=$RQ_QUEUE_NAME,RQ_WORKER_ENABLED=$RQ_WORKER_ENABLED"
+
+# The web service only enqueues job triggers when RQ is enabled; this worker
+# pool runs the same image as an `rq worker` that consumes them.
+if [ "$RQ_WORKER_ENABLED" = "true" ]; then
+    gcloud beta run worker-pools deploy translation-app-worker \
+        --project=${PROJECT_ID} \
+        --image=${REGION}-docker.pkg.dev/${PROJECT_ID}/${REPO}/${IMAGE_NAME}:latest \
+        --region=${REGION} \
+        --command=rq \
+        --args="worker,${RQ_QUEUE_NAME},--url,${REDIS_URL}" \
+        --set-env-vars="GCP_PROJECT_ID=$PROJECT_ID,GCP_REGION=$REGION,CLOUD_RUN_JOB_NAME=$JOB_NAME,REDIS_URL=$REDIS_URL,RQ_QUEUE_NAME=$RQ_QUEUE_NAME,RQ_WORKER_ENABLED=$RQ_WORKER_ENABLED"
+fi
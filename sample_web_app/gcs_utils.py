@@ -0,0 +1,64 @@
+import logging
+import threading
+from typing import IO
+
+from google.cloud import storage
+
+logger = logging.getLogger(__name__)
+
+# Resumable uploads are sent in 15 MiB requests; the SDK default is far smaller.
+UPLOAD_CHUNK_SIZE = 15 * 1024 * 1024
+
+# Shared by all requests in this process, so uploads reuse authenticated
+# connections; created on first use so importing the app needs no credentials
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> storage.Client:
+    """Returns the shared storage client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = storage.Client()
+    return _client
+
+
+def gcs_blob(bucket_name: str, blob_name: str) -> storage.Blob:
+    """
+    Returns a blob handle configured for chunked resumable uploads.
+
+    Args:
+        bucket_name: The GCS bucket holding the object.
+        blob_name: The object path within the bucket.
+
+    Returns:
+        A `storage.Blob` with `UPLOAD_CHUNK_SIZE` applied.
+    """
+    return _get_client().bucket(bucket_name).blob(blob_name, chunk_size=UPLOAD_CHUNK_SIZE)
+
+
+def upload_stream_to_gcs(
+    stream: IO[bytes],
+    bucket_name: str,
+    blob_name: str,
+    content_type: str = 'text/plain'
+) -> str:
+    """
+    Streams a file-like object to Google Cloud Storage without buffering it in memory.
+
+    Args:
+        stream: A readable binary stream, e.g. the `.stream` of an uploaded file.
+        bucket_name: The destination GCS bucket.
+        blob_name: The destination object path within the bucket.
+        content_type: The content type to store on the object.
+
+    Returns:
+        The GCS URI of the uploaded object.
+    """
+    blob = gcs_blob(bucket_name, blob_name)
+
+    logger.info(f"Streaming upload to gs://{bucket_name}/{blob_name}")
+    blob.upload_from_file(stream, rewind=False, content_type=content_type)
+    return f"gs://{bucket_name}/{blob_name}"
@@ -0,0 +1,110 @@
+import logging
+import threading
+from typing import Dict, List, Optional
+
+import redis
+from cachetools import TTLCache
+
+from config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+if CONFIG.REDIS_URL:
+    # A single blocking pool per process: every gunicorn worker/thread shares it,
+    # and requests wait for a free connection instead of opening new sockets.
+    _pool = redis.BlockingConnectionPool.from_url(
+        CONFIG.REDIS_URL,
+        max_connections=CONFIG.REDIS_MAX_CONNECTIONS,
+        decode_responses=True,
+    )
+    redis_client = redis.Redis(connection_pool=_pool)
+else:
+    # Local development without Redis: state is per-process and bounded in size
+    # and age. TTLCache mutates itself on reads (expiry), so a single lock guards
+    # every access; each critical section is a handful of dict operations.
+    logger.warning("REDIS_URL is not set; job state is kept in process memory.")
+    redis_client = None
+    _jobs = TTLCache(maxsize=CONFIG.MAX_IN_MEMORY_JOBS, ttl=CONFIG.JOB_TTL_SECONDS)
+    _jobs_lock = threading.Lock()
+
+
+def _job_key(session_id: str) -> str:
+    return f"job:{session_id}"
+
+
+def save_job(session_id: str, **fields) -> None:
+    """
+    Creates or updates the stored state of a translation job.
+
+    Fields set to None are skipped, as Redis hashes cannot hold null values.
+    The job's expiry is refreshed on every write.
+
+    Args:
+        session_id (str): The translation session identifier.
+        **fields: Job attributes to store (status, gcs_bucket, error, ...).
+    """
+    mapping = {key: value for key, value in fields.items() if value is not None}
+    if not mapping:
+        return
+
+    if redis_client is None:
+        with _jobs_lock:
+            job = _jobs.get(session_id, {})
+            job.update(mapping)
+            _jobs[session_id] = job
+        return
+
+    key = _job_key(session_id)
+    pipe = redis_client.pipeline()
+    pipe.hset(key, mapping=mapping)
+    pipe.expire(key, CONFIG.JOB_TTL_SECONDS)
+    pipe.execute()
+
+
+def get_job(session_id: str) -> Optional[dict]:
+    """
+    Returns the stored state of a translation job, or None if it is unknown.
+    """
+    if redis_client is None:
+        with _jobs_lock:
+            job = _jobs.get(session_id)
+            return dict(job) if job else None
+
+    job = redis_client.hgetall(_job_key(session_id))
+    return job or None
+
+
+def get_jobs(session_ids: List[str]) -> Dict[str, Optional[dict]]:
+    """
+    Returns the stored state of several translation jobs in one round-trip.
+
+    Args:
+        session_ids (list[str]): The translation session identifiers.
+
+    Returns:
+        dict: Job state keyed by session_id; unknown sessions map to None.
+    """
+    if redis_client is None:
+        with _jobs_lock:
+            jobs = [_jobs.get(session_id) for session_id in session_ids]
+        return {
+            session_id: dict(job) if job else None
+            for session_id, job in zip(session_ids, jobs)
+        }
+
+    pipe = redis_client.pipeline(transaction=False)
+    for session_id in session_ids:
+        pipe.hgetall(_job_key(session_id))
+    return {
+        session_id: job or None
+        for session_id, job in zip(session_ids, pipe.execute())
+    }
+
+
+def job_exists(session_id: str) -> bool:
+    """Checks whether a translation job is known to the store."""
+    if redis_client is None:
+        with _jobs_lock:
+            return session_id in _jobs
+
+    return bool(redis_client.exists(_job_key(session_id)))
@@ -1,13 +1,29 @@
 import logging
+import threading
 from google.cloud import run_v2
-from config import Config  # Import the configuration class
+from config import CONFIG  # Settings validated once at import
 
 logger = logging.getLogger(__name__)
 
+# The client holds a gRPC channel and credentials, so it is created once per process
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> run_v2.JobsClient:
+    """Returns the shared Cloud Run JobsClient, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = run_v2.JobsClient()
+    return _client
+
 def run_translation_job(overrides: dict):
     """
     Triggers a Google Cloud Run Job with specified container overrides.
-    Configuration (Project, Region, Job Name) is loaded directly from config.py.
+    Configuration (Project, Region, Job Name) is loaded from config.py, which
+    validates it once at import.
 
     Args:
         overrides (dict): A dictionary containing container override settings.
@@ -20,23 +36,15 @@ def run_translation_job(overrides: dict):
         The operation object returned by the `run_job` API call.
 
     Raises:
-        ValueError: If required GCP configuration is missing.
         Exception: If the Cloud Run job fails to trigger.
     """
-    # Ensure critical configuration exists before attempting to call the API
-    if not all([Config.GCP_PROJECT_ID, Config.GCP_REGION, Config.CLOUD_RUN_JOB_NAME]):
-        raise ValueError(
-            f"Missing required GCP configuration in config.py. "
-            f"PROJECT_ID: {Config.GCP_PROJECT_ID}, REGION: {Config.GCP_REGION}, JOB_NAME: {Config.CLOUD_RUN_JOB_NAME}"
-        )
-
-    client = run_v2.JobsClient()
+    client = _get_client()
 
-    # Use variables from Config class
+    # Use variables from the shared CONFIG
     job_path = (
-        f"projects/{Config.GCP_PROJECT_ID}/"
-        f"locations/{Config.GCP_REGION}/"
-        f"jobs/{Config.CLOUD_RUN_JOB_NAME}"
+        f"projects/{CONFIG.GCP_PROJECT_ID}/"
+        f"locations/{CONFIG.GCP_REGION}/"
+        f"jobs/{CONFIG.CLOUD_RUN_JOB_NAME}"
     )
 
     # Process environment variable overrides if present
@@ -59,13 +67,13 @@ def run_translation_job(overrides: dict):
     )
 
     try:
-        logger.info(f"Triggering Cloud Run Job '{Config.CLOUD_RUN_JOB_NAME}' "
-                    f"in {Config.GCP_REGION} with overrides: {overrides.get('args')}")
+        logger.info(f"Triggering Cloud Run Job '{CONFIG.CLOUD_RUN_JOB_NAME}' "
+                    f"in {CONFIG.GCP_REGION} with overrides: {overrides.get('args')}")
         
         response = client.run_job(request=request)
         
         logger.info(f"Cloud Run Job triggered successfully. Operation details: {response}")
         return response
     except Exception as e:
-        logger.error(f"Failed to trigger Cloud Run Job '{Config.CLOUD_RUN_JOB_NAME}': {e}", exc_info=True)
+        logger.error(f"Failed to trigger Cloud Run Job '{CONFIG.CLOUD_RUN_JOB_NAME}': {e}", exc_info=True)
         raise
\ No newline at end of file
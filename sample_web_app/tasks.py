@@ -0,0 +1,46 @@
+import logging
+
+import redis
+from rq import Queue
+
+from config import CONFIG
+from job_store import save_job
+from run_job import run_translation_job
+
+logger = logging.getLogger(__name__)
+
+# RQ stores pickled payloads, so its connection must not decode responses.
+# Without a worker consuming the queue, jobs are triggered within the request.
+translation_queue = Queue(
+    CONFIG.RQ_QUEUE_NAME,
+    connection=redis.Redis.from_url(CONFIG.REDIS_URL),
+) if CONFIG.RQ_WORKER_ENABLED else None
+
+
+def trigger_translation_job(session_id: str, job_args: list) -> str:
+    """
+    Background task that triggers the Cloud Run job and records the outcome.
+
+    Runs inside an RQ worker (`rq worker translation-jobs`), so the web request
+    that enqueued it returns without waiting on the Cloud Run API.
+
+    Args:
+        session_id (str): The translation session identifier.
+        job_args (list[str]): Command-line arguments for the job's container.
+
+    Returns:
+        The name of the Cloud Run operation.
+    """
+    try:
+        operation = run_translation_job(overrides={"args": job_args})
+    except Exception as e:
+        logger.error(f"Failed to trigger Cloud Run job for session {session_id}: {e}", exc_info=True)
+        save_job(session_id, status='failed', error=str(e))
+        raise
+
+    operation_name = operation.name if hasattr(operation, 'name') else str(operation)
+    save_job(session_id, operation_name=operation_name, status='running')
+
+    logger.info(f"Job successfully triggered for session {session_id}")
+    logger.info(f"Operation name: {operation_name}")
+    return operation_name
@@ -3,11 +3,48 @@ EPUB Reader - Extracts content from EPUB files.
 
 This module properly extracts EPUB content and converts it to plain text.
 """
+import functools
+import io
+import multiprocessing
 import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from xml.etree import ElementTree as ET
-import re
-import html
+from typing import BinaryIO, Iterator, Optional, TextIO, Tuple
+from lxml import etree as ET
+from lxml import html as lxml_html
+
+# Body tag with and without the XHTML namespace
+_BODY_TAGS = ('{http://www.w3.org/1999/xhtml}body', 'body')
+
+# Manifest entry: content path relative to the OPF and its declared media type
+ManifestItem = namedtuple('ManifestItem', 'href media_type')
+
+# Media types of spine entries that carry readable text; items without a
+# declared media type are still attempted
+_CONTENT_MEDIA_TYPES = frozenset({'application/xhtml+xml', 'text/html', ''})
+
+# Qualified OPF package document tags
+_OPF_NS = '{http://www.idpf.org/2007/opf}'
+_DC_NS = '{http://purl.org/dc/elements/1.1/}'
+_OPF_METADATA = _OPF_NS + 'metadata'
+_OPF_ITEM = _OPF_NS + 'item'
+_OPF_ITEMREF = _OPF_NS + 'itemref'
+_DC_TITLE = _DC_NS + 'title'
+_DC_CREATOR = _DC_NS + 'creator'
+
+# Recovery errors raised for entities XML does not define (e.g. &nbsp;); with
+# a DOCTYPE declaring an external DTD, libxml2 reports them as warnings
+_UNDECLARED_ENTITY_ERRORS = frozenset((
+    ET.ErrorTypes.ERR_UNDECLARED_ENTITY,
+    ET.ErrorTypes.WAR_UNDECLARED_ENTITY,
+))
+
+# HTML parser for chapters with undeclared entities; EPUB content documents are UTF-8
+_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+# Chapters are read through a larger buffer than zipfile's default
+_READ_BUFFER_SIZE = 1 << 20
 
 
 class EPUBHandler:
@@ -20,45 +57,93 @@ class EPUBHandler:
         self.spine_order = []
         self.manifest = {}
         
-    def read_epub_to_text(self) -> str:
+    def read_epub_to_text(self, max_workers: Optional[int] = None) -> str:
         """
         Read EPUB file and return content as a single plain text string.
         
+        Args:
+            max_workers (int, optional): Processes used to parse content files
+                in parallel. Defaults to parsing in-process.
+
         Returns:
             str: Plain text content of the EPUB.
         """
+        buffer = io.StringIO()
+        self.read_epub_to_writer(buffer, max_workers)
+        return buffer.getvalue()
+
+    def read_epub_to_writer(self, out: TextIO, max_workers: Optional[int] = None) -> int:
+        """
+        Read EPUB file and write its plain text to a writable text stream.
+
+        Chapters are written as soon as they are extracted, separated by a blank
+        line, so the whole book is never held in memory at once.
+
+        Args:
+            out (TextIO): Destination stream, e.g. a file opened in text mode.
+            max_workers (int, optional): Processes used to parse content files
+                in parallel. Defaults to parsing in-process.
+
+        Returns:
+            int: Number of characters written.
+        """
         if not self.epub_path.exists():
             raise FileNotFoundError(f"EPUB file not found: {self.epub_path}")
         
+        # Metadata and structure from the OPF, reused across reads of the same file
+        self._load_package()
+        
         with zipfile.ZipFile(self.epub_path, 'r') as epub_zip:
-            # Get the OPF file path
-            content_opf_path = self._find_opf_path(epub_zip)
-            content_dir = str(Path(content_opf_path).parent) if content_opf_path else ''
-            
-            # Parse OPF for metadata and structure
-            opf_content = epub_zip.read(content_opf_path).decode('utf-8')
-            self._parse_opf(opf_content, content_dir)
-            
-            # Extract content files in reading order
-            text_parts = []
+            # Write content files in reading order
+            written = 0
+            for text_content in self._iter_content_texts(epub_zip, max_workers):
+                if not text_content:
+                    continue
+                if written:
+                    written += out.write('\n\n')
+                written += out.write(text_content)
             
+            return written
+
+    def _load_package(self):
+        """Populate metadata, manifest and spine order from the cached OPF parse."""
+        stat = self.epub_path.stat()
+        metadata, manifest, content_files = _load_package_cached(
+            str(self.epub_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+        self.metadata = dict(metadata)
+        self.manifest = dict(manifest)
+        self.content_files = list(content_files)
+
+    def _iter_content_texts(self, epub_zip: zipfile.ZipFile, max_workers: Optional[int]) -> Iterator[str]:
+        """
+        Yield the plain text of each content file in spine order.
+
+        Parsing a chapter takes milliseconds, far less than starting a worker,
+        so chapters are parsed in-process unless the caller asks for more than
+        one worker. The pool then never outgrows the number of chapters; each
+        worker opens the archive once and results come back in submission order.
+        """
+        if not max_workers or max_workers <= 1 or len(self.content_files) <= 1:
             for content_file in self.content_files:
-                try:
-                    raw_content = epub_zip.read(content_file).decode('utf-8', errors='replace')
-                    # Extract plain text from the XHTML content
-                    text_content = self._extract_text_from_xhtml(raw_content)
-                    if text_content:
-                        text_parts.append(text_content)
-                except Exception as e:
-                    print(f"Warning: Could not process {content_file}: {e}")
-            
-            return '\n\n'.join(text_parts)
+                yield _extract_content_text(epub_zip, content_file)
+            return
+
+        # Workers are spawned rather than forked: the pipeline process holds
+        # live gRPC channels, which are not safe to fork
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(self.content_files)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(str(self.epub_path),)
+        ) as executor:
+            yield from executor.map(_extract_content_text_in_worker, self.content_files, chunksize=4)
     
     def _find_opf_path(self, epub_zip: zipfile.ZipFile) -> str:
         """Find the content.opf file path from container.xml"""
         try:
-            container_content = epub_zip.read('META-INF/container.xml')
-            container_tree = ET.fromstring(container_content)
+            with epub_zip.open('META-INF/container.xml') as container_stream:
+                container_tree = ET.parse(container_stream).getroot()
             ns = {'ns': 'urn:oasis:names:tc:opendocument:xmlns:container'}
             rootfile = container_tree.find('.//ns:rootfile', ns)
             
@@ -68,79 +153,136 @@ class EPUBHandler:
             pass
         
         # Fallback to common locations
+        names = set(epub_zip.namelist())
         for path in ['OEBPS/content.opf', 'content.opf', 'EPUB/content.opf']:
-            if path in epub_zip.namelist():
+            if path in names:
                 return path
         
         raise ValueError("Could not find content.opf in EPUB")
     
-    def _parse_opf(self, opf_content: str, content_dir: str):
+    def _parse_opf(self, opf_stream: BinaryIO, content_dir: str):
         """Parse OPF file to get manifest and spine"""
-        opf_tree = ET.fromstring(opf_content)
+        opf_tree = ET.parse(opf_stream).getroot()
         
-        ns = {
-            'opf': 'http://www.idpf.org/2007/opf',
-            'dc': 'http://purl.org/dc/elements/1.1/'
-        }
+        # Walk the package document once, dispatching on the qualified tag
+        # instead of running a separate path search per section
+        has_metadata = False
+        title = creator = None
+        spine_idrefs = []
+        for elem in opf_tree.iter():
+            tag = elem.tag
+            if tag == _OPF_ITEM:
+                item_id = elem.get('id')
+                href = elem.get('href')
+                media_type = elem.get('media-type', '')
+                if item_id and href:
+                    self.manifest[item_id] = ManifestItem(href, media_type)
+            elif tag == _OPF_ITEMREF:
+                spine_idrefs.append(elem.get('idref'))
+            elif tag == _DC_TITLE:
+                if title is None:
+                    title = elem
+            elif tag == _DC_CREATOR:
+                if creator is None:
+                    creator = elem
+            elif tag == _OPF_METADATA:
+                has_metadata = True
         
         # Extract metadata
-        metadata = opf_tree.find('.//opf:metadata', ns)
-        if metadata is not None:
-            title = metadata.find('.//dc:title', ns)
+        if has_metadata:
             self.metadata['title'] = title.text if title is not None else 'Unknown'
-            
-            creator = metadata.find('.//dc:creator', ns)
             self.metadata['author'] = creator.text if creator is not None else 'Unknown'
         
-        # Build manifest
-        manifest = opf_tree.find('.//opf:manifest', ns)
-        if manifest is not None:
-            for item in manifest.findall('opf:item', ns):
-                item_id = item.get('id')
-                href = item.get('href')
-                media_type = item.get('media-type', '')
-                if item_id and href:
-                    self.manifest[item_id] = {
-                        'href': href,
-                        'media_type': media_type
-                    }
-        
-        # Get spine order
-        spine = opf_tree.find('.//opf:spine', ns)
-        if spine is not None:
-            for itemref in spine.findall('opf:itemref', ns):
-                idref = itemref.get('idref')
-                if idref in self.manifest:
-                    href = self.manifest[idref]['href']
-                    full_path = f"{content_dir}/{href}" if content_dir and content_dir != '.' else href
-                    self.content_files.append(full_path)
+        # Get spine order (resolved after the walk, as the manifest may come later),
+        # skipping stylesheets, images and other non-document spine entries
+        for idref in spine_idrefs:
+            item = self.manifest.get(idref)
+            if item is not None and item.media_type in _CONTENT_MEDIA_TYPES:
+                href = item.href
+                full_path = f"{content_dir}/{href}" if content_dir and content_dir != '.' else href
+                self.content_files.append(full_path)
     
-    def _extract_text_from_xhtml(self, xhtml_content: str) -> str:
-        """Extract plain text from an XHTML content string."""
-        try:
-            # Clean up XML declaration for robust parsing
-            content = re.sub(r'<\?xml[^>]*\?>', '', xhtml_content, count=1)
-            tree = ET.fromstring(content)
-
-            # Find the body tag, considering namespaces
-            body = tree.find('.//{http://www.w3.org/1999/xhtml}body')
-            if body is None:
-                body = tree.find('.//body')
+    @staticmethod
+    def _extract_text_from_xhtml(epub_zip: zipfile.ZipFile, content_file: str) -> str:
+        """
+        Extract plain text from an XHTML content file in the EPUB archive.
 
-            if body is not None:
+        The file is stream-parsed straight from the archive with libxml2, so only
+        the current chapter's tree is held in memory and no decoded copy of it
+        is made.
+        """
+        with epub_zip.open(content_file) as raw, io.BufferedReader(raw, _READ_BUFFER_SIZE) as xhtml_stream:
+            # libxml2 recovers from unclosed tags and similar damage in-parser,
+            # so malformed chapters need no second pass
+            context = ET.iterparse(
+                xhtml_stream, events=('end',), tag=_BODY_TAGS, recover=True, huge_tree=True
+            )
+            for _, elem in context:
                 # Join all text nodes within the body
-                plain_text = ' '.join(body.itertext()).strip()
-                return html.unescape(plain_text)
+                plain_text = ' '.join(elem.itertext()).strip()
+                elem.clear()
+                break
+            else:
+                plain_text = "" # Empty string if no body is found
+
+        if any(error.type in _UNDECLARED_ENTITY_ERRORS for error in context.error_log):
+            # HTML named entities such as &nbsp; are undefined in plain XML and
+            # recovery drops them; the HTML parser knows them
+            with epub_zip.open(content_file) as raw, io.BufferedReader(raw, _READ_BUFFER_SIZE) as xhtml_stream:
+                document = lxml_html.parse(xhtml_stream, _HTML_PARSER).getroot()
+            bodies = document.xpath('//body')
+            text = (bodies[0] if bodies else document).text_content()
+            return ' '.join(text.split())
+
+        # itertext() yields entity-decoded text already
+        return plain_text
+
+
+@functools.lru_cache(maxsize=128)
+def _load_package_cached(epub_path: str, mtime_ns: int, size: int) -> Tuple[dict, dict, Tuple[str, ...]]:
+    """
+    Parse an EPUB's container.xml and OPF once per file version.
 
-        except ET.ParseError:
-            # Fallback for malformed XML: regex to strip tags
-            body_match = re.search(r'<body[^>]*>(.*?)</body>', xhtml_content, re.DOTALL | re.IGNORECASE)
-            content_to_clean = body_match.group(1) if body_match else xhtml_content
-            text = re.sub(r'<[^>]+>', ' ', content_to_clean)
-            clean_text = ' '.join(text.split()).strip()
-            return html.unescape(clean_text)
+    The modification time and size are part of the cache key, so a rewritten
+    file is parsed again. Callers must copy the returned containers.
+
+    Returns:
+        tuple: (metadata, manifest, content_files in spine order)
+    """
+    handler = EPUBHandler(epub_path)
+    with zipfile.ZipFile(epub_path, 'r') as epub_zip:
+        # Get the OPF file path
+        content_opf_path = handler._find_opf_path(epub_zip)
+        content_dir = str(Path(content_opf_path).parent) if content_opf_path else ''
+        
+        # Parse OPF for metadata and structure
+        with epub_zip.open(content_opf_path) as opf_stream:
+            handler._parse_opf(opf_stream, content_dir)
+
+    return handler.metadata, handler.manifest, tuple(handler.content_files)
+
+
+def _extract_content_text(epub_zip: zipfile.ZipFile, content_file: str) -> str:
+    """Extract a content file's text, reporting failures instead of raising."""
+    try:
+        return EPUBHandler._extract_text_from_xhtml(epub_zip, content_file)
+    except Exception as e:
+        print(f"Warning: Could not process {content_file}: {e}")
+        return ""
 
-        return "" # Return empty string if nothing is found
+
+# Archive handle opened once per pool worker process
+_worker_zip: Optional[zipfile.ZipFile] = None
+
+
+def _init_worker(epub_path: str):
+    """Pool initializer: open the EPUB archive in the worker process."""
+    global _worker_zip
+    _worker_zip = zipfile.ZipFile(epub_path, 'r')
+
+
+def _extract_content_text_in_worker(content_file: str) -> str:
+    return _extract_content_text(_worker_zip, content_file)
 
 
 # Convenience functions for backward compatibility
@@ -165,14 +307,12 @@ if __name__ == '__main__':
         output_file = sys.argv[3] if len(sys.argv) > 3 else Path(epub_file).stem + '_output.txt'
         
         try:
-            text_content = read_epub_to_text(epub_file)
-            
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(text_content)
+                length = EPUBHandler(epub_file).read_epub_to_writer(f)
             
             print(f"✓ Successfully converted EPUB to plain text")
             print(f"✓ Output: {output_file}")
-            print(f"✓ Length: {len(text_content):,} characters")
+            print(f"✓ Length: {length:,} characters")
             
         except Exception as e:
             print(f"✗ Error: {e}", file=sys.stderr)
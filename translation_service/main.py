@@ -29,6 +29,10 @@ def main():
     # Optional arguments from web_app/main.py
     parser.add_argument("--max-chunk-size", type=int, help="Maximum size of a chunk in characters.")
     parser.add_argument("--max-number-of-chunks", type=int, default=None, help="Maximum number of chunks to process.")
+    parser.add_argument("--entity-instructions", help="User-provided entity glossary text.")
+    parser.add_argument("--style-instructions", help="User-provided style instructions text.")
+    parser.add_argument("--entity-instructions-gcs", help="GCS URI of a user-provided entity glossary file.")
+    parser.add_argument("--style-instructions-gcs", help="GCS URI of a user-provided style instructions file.")
 
     # Parse args
     args = parser.parse_args()
@@ -52,7 +56,17 @@ def main():
     # 3. Execute Pipeline
     try:
         pipeline = TranslationPipeline(config)
-        result = pipeline.execute()
+
+        # Uploaded instruction files arrive as GCS URIs rather than inline text
+        entity_content = args.entity_instructions
+        if args.entity_instructions_gcs:
+            entity_content = pipeline.gcs.read_uri_text(args.entity_instructions_gcs)
+
+        style_content = args.style_instructions
+        if args.style_instructions_gcs:
+            style_content = pipeline.gcs.read_uri_text(args.style_instructions_gcs)
+
+        result = pipeline.execute(entity_content=entity_content, style_content=style_content)
         
         if result['success']:
             logger.info("Job completed successfully.")
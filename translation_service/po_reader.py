@@ -1,26 +1,58 @@
 """
 PO File Reader - Extract and convert gettext .po file content to plain text
 """
+import io
+import mmap
+import os
 import re, polib
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 
+# Section separators and line break used by the plain text format
+_SEP_EQ = "=" * 80
+_SEP_DASH = "-" * 80
+_NL = "\n"
 
+# Translation placeholder written by read_po_to_text for empty msgstrs
+_NOT_TRANSLATED = "(not translated)"
+
+# Entry status labels, indexed by 0 untranslated, 1 translated, 2 fuzzy, 3 obsolete
+_STATUS_LABELS = ("[UNTRANSLATED]", "[TRANSLATED]", "[FUZZY]", "[OBSOLETE]")
+
+# Entry separator line in the text written by read_po_to_text; matched as a
+# whole line so dashes inside entry text never split a block
+_RE_BLOCK_BOUNDARY = re.compile(rb'(?m)^-{80}\r?$')
+
+# Section header lines of an entry block and the field each one starts
+_SECTION_HEADERS = {'Original:': 'msgid', 'Plural:': 'msgid_plural', 'Translation:': 'msgstr'}
+
+# Plural translation line written by read_po_to_text: "  [Plural form N]: text"
+_RE_PLURAL_OUT = re.compile(r'\s*\[Plural form (\d+)\]:\s*(.*)')
+
+# Entry separator line in decoded text, captured so a split chunk can be rejoined
+_RE_TEXT_BLOCK_BOUNDARY = re.compile(r'(?m)(^-{80}\r?\n?)')
+
+# printf-style ("%s", "%1$d", "%(name)s") and brace ("{0}", "{{var}}") placeholders
+_RE_PLACEHOLDER = re.compile(r'%(?:\(\w+\))?(?:\d+\$)?[-+ #0]*\d*(?:\.\d+)?[a-zA-Z]|\{\{?\s*[\w.]*\s*\}\}?')
+
+
+@dataclass(slots=True)
 class POEntry:
     """Represents a single entry in a PO file."""
     
-    def __init__(self):
-        self.msgctxt: Optional[str] = None  # Message context
-        self.msgid: str = ""  # Original text
-        self.msgid_plural: Optional[str] = None  # Plural form
-        self.msgstr: str = ""  # Translated text
-        self.msgstr_plural: Dict[int, str] = {}  # Plural translations
-        self.comments: List[str] = []  # Translator comments
-        self.extracted_comments: List[str] = []  # Extracted comments
-        self.references: List[str] = []  # Source code references
-        self.flags: List[str] = []  # Flags like fuzzy, python-format
-        self.previous_msgid: Optional[str] = None  # Previous msgid (for fuzzy)
-        self.obsolete: bool = False  # Obsolete entry
+    msgctxt: Optional[str] = None  # Message context
+    msgid: str = ""  # Original text
+    msgid_plural: Optional[str] = None  # Plural form
+    msgstr: str = ""  # Translated text
+    msgstr_plural: Dict[int, str] = field(default_factory=dict)  # Plural translations
+    comments: List[str] = field(default_factory=list)  # Translator comments
+    extracted_comments: List[str] = field(default_factory=list)  # Extracted comments
+    references: List[str] = field(default_factory=list)  # Source code references
+    flags: List[str] = field(default_factory=list)  # Flags like fuzzy, python-format
+    previous_msgid: Optional[str] = None  # Previous msgid (for fuzzy)
+    obsolete: bool = False  # Obsolete entry
     
     def is_translated(self) -> bool:
         """Check if entry has a translation."""
@@ -58,148 +90,138 @@ def read_po_to_text(po_path, include_untranslated=True, include_fuzzy=True,
     if not po_path.exists():
         raise FileNotFoundError(f"PO file not found: {po_path}")
     
-    # Read and parse the PO file
-    with open(po_path, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
-    
-    entries = _parse_po_file(content)
+    # Parse the PO file; polib keeps the header apart from the regular entries
+    po = polib.pofile(str(po_path), encoding='utf-8', wrapwidth=0)
     
-    # Separate metadata from regular entries
-    metadata = None
-    regular_entries = []
+    metadata = _from_polib_entry(po.metadata_as_entry()) if po.metadata else None
+    regular_entries = [_from_polib_entry(entry) for entry in po]
     
-    for entry in entries:
-        if entry.msgid == "" and not entry.obsolete:
-            metadata = entry
-        else:
-            regular_entries.append(entry)
-    
-    # Build plain text output
-    text_parts = []
+    # Build plain text output: add() writes one line, fixed multi-line
+    # fragments in the entry loop go out in a single write()
+    buf = io.StringIO()
+    write = buf.write
+
+    def add(line: str = ""):
+        write(line)
+        write(_NL)
     
     # Add metadata section
     if include_metadata and metadata:
-        text_parts.append("=" * 80)
-        text_parts.append("METADATA")
-        text_parts.append("=" * 80)
+        add(_SEP_EQ)
+        add("METADATA")
+        add(_SEP_EQ)
         
         if metadata.msgstr:
-            lines = metadata.msgstr.split('\\n')
+            lines = metadata.msgstr.split('\n')
             for line in lines:
                 if line.strip():
-                    text_parts.append(line)
+                    add(line)
         
-        text_parts.append("")
+        add()
     
-    # Calculate statistics
+    # Calculate statistics in a single pass, keeping each entry's (translated, fuzzy, obsolete)
+    # status for the output loop below
     total = len(regular_entries)
-    translated = sum(1 for e in regular_entries if e.is_translated() and not e.is_fuzzy())
-    fuzzy = sum(1 for e in regular_entries if e.is_fuzzy())
-    untranslated = sum(1 for e in regular_entries if not e.is_translated())
-    obsolete_count = sum(1 for e in regular_entries if e.obsolete)
+    translated = fuzzy = untranslated = obsolete_count = 0
+    statuses = []
+    for e in regular_entries:
+        is_translated = e.is_translated()
+        is_fuzzy = e.is_fuzzy()
+        statuses.append((is_translated, is_fuzzy, e.obsolete))
+        translated += is_translated and not is_fuzzy
+        fuzzy += is_fuzzy
+        untranslated += not is_translated
+        obsolete_count += e.obsolete
     
     # Add statistics
-    text_parts.append("=" * 80)
-    text_parts.append("STATISTICS")
-    text_parts.append("=" * 80)
-    text_parts.append(f"Total Entries: {total}")
-    text_parts.append(f"Translated: {translated}")
-    text_parts.append(f"Fuzzy: {fuzzy}")
-    text_parts.append(f"Untranslated: {untranslated}")
+    add(_SEP_EQ)
+    add("STATISTICS")
+    add(_SEP_EQ)
+    add(f"Total Entries: {total}")
+    add(f"Translated: {translated}")
+    add(f"Fuzzy: {fuzzy}")
+    add(f"Untranslated: {untranslated}")
     if obsolete_count > 0:
-        text_parts.append(f"Obsolete: {obsolete_count}")
+        add(f"Obsolete: {obsolete_count}")
     
     if total > 0:
         completion = (translated / total) * 100
-        text_parts.append(f"Completion: {completion:.1f}%")
+        add(f"Completion: {completion:.1f}%")
     
-    text_parts.append("")
-    text_parts.append("=" * 80)
-    text_parts.append("ENTRIES")
-    text_parts.append("=" * 80)
-    text_parts.append("")
+    add()
+    add(_SEP_EQ)
+    add("ENTRIES")
+    add(_SEP_EQ)
+    add()
     
     # Add entries
-    for i, entry in enumerate(regular_entries, 1):
-        # Skip based on filters
-        if entry.obsolete and not include_obsolete:
-            continue
-        if entry.is_fuzzy() and not include_fuzzy:
-            continue
-        if not entry.is_translated() and not include_untranslated:
-            continue
-        
-        # Entry separator
-        text_parts.append("-" * 80)
-        
-        # Status indicator
-        if entry.obsolete:
-            text_parts.append(f"[Entry {i}] [OBSOLETE]")
-        elif entry.is_fuzzy():
-            text_parts.append(f"[Entry {i}] [FUZZY]")
-        elif entry.is_translated():
-            text_parts.append(f"[Entry {i}] [TRANSLATED]")
-        else:
-            text_parts.append(f"[Entry {i}] [UNTRANSLATED]")
-        
-        text_parts.append("")
+    # Select the entries to output up front; numbering follows the file order
+    selected = [
+        (i, entry, status)
+        for i, (entry, status) in enumerate(zip(regular_entries, statuses), 1)
+        if (include_obsolete or not status[2])
+        and (include_fuzzy or not status[1])
+        and (include_untranslated or status[0])
+    ]
+    
+    for i, entry, (is_translated, is_fuzzy, obsolete) in selected:
+        # Entry separator and status indicator, by precedence: obsolete, fuzzy, translated
+        label = _STATUS_LABELS[3 if obsolete else 2 if is_fuzzy else 1 if is_translated else 0]
+        write(f"{_SEP_DASH}\n[Entry {i}] {label}\n\n")
         
         # Add flags
         if entry.flags and include_comments:
-            text_parts.append(f"Flags: {', '.join(entry.flags)}")
-            text_parts.append("")
+            write(f"Flags: {', '.join(entry.flags)}\n\n")
         
         # Add context
         if entry.msgctxt:
-            text_parts.append(f"Context: {entry.msgctxt}")
-            text_parts.append("")
+            write(f"Context: {entry.msgctxt}\n\n")
         
         # Add comments
         if include_comments:
             if entry.comments:
                 for comment in entry.comments:
-                    text_parts.append(f"# {comment}")
+                    add(f"# {comment}")
             
             if entry.extracted_comments:
                 for comment in entry.extracted_comments:
-                    text_parts.append(f"#. {comment}")
+                    add(f"#. {comment}")
             
             if entry.references:
                 for ref in entry.references:
-                    text_parts.append(f"#: {ref}")
+                    add(f"#: {ref}")
             
             if entry.comments or entry.extracted_comments or entry.references:
-                text_parts.append("")
+                add()
         
         # Add msgid
-        text_parts.append("Original:")
-        text_parts.append(entry.msgid)
-        text_parts.append("")
+        write(f"Original:\n{entry.msgid}\n\n")
         
         # Add msgid_plural if exists
         if entry.msgid_plural:
-            text_parts.append("Plural:")
-            text_parts.append(entry.msgid_plural)
-            text_parts.append("")
+            write(f"Plural:\n{entry.msgid_plural}\n\n")
         
         # Add msgstr
-        text_parts.append("Translation:")
+        add("Translation:")
         if entry.msgstr_plural:
             for idx, text in sorted(entry.msgstr_plural.items()):
-                display_text = text if text.strip() else "(not translated)"
-                text_parts.append(f"  [Plural form {idx}]: {display_text}")
+                display_text = text if text.strip() else _NOT_TRANSLATED
+                add(f"  [Plural form {idx}]: {display_text}")
         else:
-            display_text = entry.msgstr if entry.msgstr.strip() else "(not translated)"
-            text_parts.append(display_text)
+            display_text = entry.msgstr if entry.msgstr.strip() else _NOT_TRANSLATED
+            add(display_text)
         
-        text_parts.append("")
+        add()
         
         # Add previous msgid for fuzzy entries
         if entry.previous_msgid and include_comments:
-            text_parts.append(f"Previous msgid: {entry.previous_msgid}")
-            text_parts.append("")
+            write(f"Previous msgid: {entry.previous_msgid}\n\n")
     
-    return '\n'.join(text_parts)
+    # Drop the final newline, matching a '\n'.join of the lines
+    if buf.tell():
+        buf.seek(buf.tell() - 1)
+        buf.truncate()
+    return buf.getvalue()
 
 
 def assemble_po_from_text(text_path: str, original_po_path: str, output_po_path: str):
@@ -227,30 +249,20 @@ def assemble_po_from_text(text_path: str, original_po_path: str, output_po_path:
 
     # 1. Parse the original .po file using polib to preserve all metadata
     po = polib.pofile(original_po_path, encoding='utf-8', wrapwidth=0)
-    
-    # Create a lookup dictionary for easy access to entries
-    # Key: (msgctxt, msgid)
-    entry_map: Dict[(Optional[str], str), polib.POEntry] = {
-        (entry.msgctxt, entry.msgid): entry for entry in po
-    }
-
-    # 2. Parse the translated text file
-    with open(text_path, 'r', encoding='utf-8') as f:
-        content = f.read()
 
-    # Split content into individual entry blocks
-    entry_blocks = content.split("-" * 80)[1:] # Skip header/stats
-
-    for block in entry_blocks:
+    # 2. Parse the translated text file, one entry block at a time, collecting
+    # (key, msgstr, msgstr_plural) updates keyed by (msgctxt, msgid)
+    updates: List[Tuple[Tuple[Optional[str], str], str, Dict[int, str]]] = []
+    for block in _iter_entry_blocks(text_path):
         if not block.strip():
             continue
 
-        lines = block.strip().split('\n')
+        lines = block.strip().splitlines()
         
+        # Lines are collected per field and joined once the block is read
         msgctxt: Optional[str] = None
-        msgid = ""
-        msgid_plural: Optional[str] = None
-        msgstr = ""
+        msgid_parts: List[str] = []
+        msgstr_parts: List[str] = []
         msgstr_plural: Dict[int, str] = {}
 
         current_section = None
@@ -259,6 +271,10 @@ def assemble_po_from_text(text_path: str, original_po_path: str, output_po_path:
             if not line_strip:
                 continue
 
+            section = _SECTION_HEADERS.get(line_strip)
+            if section is not None:
+                current_section = section
+                continue
             if line_strip.startswith('[Entry'):
                 current_section = None
                 continue
@@ -266,40 +282,33 @@ def assemble_po_from_text(text_path: str, original_po_path: str, output_po_path:
                 msgctxt = line_strip.replace('Context:', '').strip()
                 current_section = None
                 continue
-            if line_strip == 'Original:':
-                current_section = 'msgid'
-                continue
-            if line_strip == 'Plural:':
-                current_section = 'msgid_plural'
-                msgid_plural = ""
-                continue
-            if line_strip == 'Translation:':
-                current_section = 'msgstr'
-                continue
 
             if current_section == 'msgid':
-                msgid += line + '\n'
-            elif current_section == 'msgid_plural':
-                msgid_plural += line + '\n'
+                msgid_parts.append(line)
             elif current_section == 'msgstr':
-                plural_match = re.match(r'\s*\[Plural form (\d+)\]:\s*(.*)', line)
+                plural_match = _RE_PLURAL_OUT.match(line)
                 if plural_match:
                     idx = int(plural_match.group(1))
                     translation = plural_match.group(2)
-                    msgstr_plural[idx] = translation if translation != '(not translated)' else ''
+                    msgstr_plural[idx] = translation if translation != _NOT_TRANSLATED else ''
                 else:
-                    msgstr += line + '\n'
+                    msgstr_parts.append(line)
 
         # Clean up collected strings
-        msgid = msgid.strip()
-        if msgid_plural:
-            msgid_plural = msgid_plural.strip()
-        msgstr = msgstr.strip()
-        if msgstr == '(not translated)':
+        msgid = '\n'.join(msgid_parts).strip()
+        msgstr = '\n'.join(msgstr_parts).strip()
+        if msgstr == _NOT_TRANSLATED:
             msgstr = ''
 
-        # 3. Find and update the corresponding entry in the polib object
-        entry = entry_map.get((msgctxt, msgid))
+        updates.append((_entry_key(msgctxt, msgid), msgstr, msgstr_plural))
+
+    # 3. Index only the entries that are being updated, then update them
+    to_update = {key for key, _, _ in updates}
+    entry_map: Dict[Tuple[Optional[str], str], polib.POEntry] = {
+        key: entry for entry in po if (key := _entry_key(entry.msgctxt, entry.msgid)) in to_update
+    }
+    for key, msgstr, msgstr_plural in updates:
+        entry = entry_map.get(key)
         if entry:
             if entry.msgid_plural is not None and msgstr_plural:
                 entry.msgstr_plural = msgstr_plural
@@ -309,152 +318,152 @@ def assemble_po_from_text(text_path: str, original_po_path: str, output_po_path:
     # 4. Save the updated .po file
     po.save(output_po_path)
 
-def _parse_po_file(content: str) -> List[POEntry]:
+
+def is_untranslatable(text: str) -> bool:
     """
-    Parse PO file content into a list of POEntry objects.
-    
+    Check whether a msgid has nothing to translate.
+
+    True for strings that are empty or made only of digits, punctuation,
+    whitespace and format placeholders; their translation is the msgid itself.
+
     Args:
-        content (str): Content of the PO file
-        
+        text (str): The msgid to check
+
+    Returns:
+        bool: True if the string contains no translatable words
+    """
+    return not any(char.isalpha() for char in _RE_PLACEHOLDER.sub('', text))
+
+
+def passthrough_translation(chunk: str) -> Optional[str]:
+    """
+    Fill in the translations of a chunk that has nothing to translate.
+
+    A chunk of read_po_to_text output qualifies when it is made only of whole
+    entry blocks whose msgids are untranslatable (see is_untranslatable). Its
+    missing translations are then set to the msgid (or msgid_plural for the
+    plural forms after the first), which is what a translation would produce;
+    existing translations are kept.
+
+    A block is whole when its translation section ends with the blank line
+    read_po_to_text writes after it, so the final entry of a document, which
+    has no trailing blank line, never qualifies.
+
+    Args:
+        chunk (str): A chunk of the text written by read_po_to_text
+
     Returns:
-        List[POEntry]: List of parsed entries
+        Optional[str]: The chunk with translations filled in, or None if any
+        part of it needs translating or is not a complete entry block
     """
-    entries = []
-    current_entry = POEntry()
-    current_field = None
+    # Alternating [text, separator, block, separator, block, ...]
+    parts = _RE_TEXT_BLOCK_BOUNDARY.split(chunk)
+    # Text before the first separator is either the metadata and statistics
+    # header or the tail of an entry cut by the chunker
+    if len(parts) < 3 or parts[0].strip():
+        return None
+
+    for i in range(2, len(parts), 2):
+        block = parts[i]
+        if not block.strip():
+            continue
+
+        head, sep, translation = block.partition('\nTranslation:\n')
+        if not sep or '\nOriginal:\n' not in head:
+            return None
+        # A cut block, or one whose msgstr spans a blank line, is left to the model
+        body = translation[:-2]
+        if not translation.endswith('\n\n') or not body or '\n\n' in body:
+            return None
+
+        msgid_text = head.split('\nOriginal:\n', 1)[1]
+        msgid, _, msgid_plural = msgid_text.partition('\n\nPlural:\n')
+        msgid = msgid.strip()
+        msgid_plural = msgid_plural.strip()
+        if not is_untranslatable(msgid) or not is_untranslatable(msgid_plural):
+            return None
+
+        lines = body.split('\n')
+        plural_forms = [_RE_PLURAL_OUT.match(line) for line in lines]
+        if all(plural_forms):
+            filled = [
+                f"  [Plural form {m.group(1)}]: {msgid if m.group(1) == '0' else msgid_plural or msgid}"
+                if m.group(2) == _NOT_TRANSLATED else line
+                for m, line in zip(plural_forms, lines)
+            ]
+        elif body == _NOT_TRANSLATED:
+            filled = [msgid]
+        else:
+            filled = lines
+        parts[i] = f"{head}{sep}{_NL.join(filled)}\n\n"
+
+    return ''.join(parts)
+
+
+def _iter_entry_blocks(text_path: str) -> Iterator[str]:
+    """
+    Yield the entry blocks of a text file written by read_po_to_text.
     
-    lines = content.split('\n')
+    The file is memory-mapped and only the current block is decoded, so the
+    whole translated text is never held in memory as a string. The header and
+    statistics before the first separator are skipped.
     
-    for line in lines:
-        # Skip empty lines at the start of an entry
-        if not line.strip() and current_field is None:
-            continue
-        
-        # Empty line marks end of entry
-        if not line.strip():
-            if current_entry.msgid is not None:
-                entries.append(current_entry)
-                current_entry = POEntry()
-                current_field = None
-            continue
-        
-        # Translator comments
-        if line.startswith('# ') and not line.startswith('#.') and not line.startswith('#:') and not line.startswith('#,') and not line.startswith('#|'):
-            current_entry.comments.append(line[2:].strip())
-            continue
-        
-        # Extracted comments
-        if line.startswith('#.'):
-            current_entry.extracted_comments.append(line[2:].strip())
-            continue
-        
-        # References
-        if line.startswith('#:'):
-            current_entry.references.append(line[2:].strip())
-            continue
-        
-        # Flags
-        if line.startswith('#,'):
-            flags = line[2:].strip().split(',')
-            current_entry.flags.extend(flag.strip() for flag in flags)
-            continue
-        
-        # Previous msgid (for fuzzy entries)
-        if line.startswith('#|'):
-            prev_match = re.match(r'#\|\s+msgid\s+"(.*)"', line)
-            if prev_match:
-                current_entry.previous_msgid = _unescape_string(prev_match.group(1))
-            continue
-        
-        # Obsolete entries
-        if line.startswith('#~'):
-            current_entry.obsolete = True
-            line = line[2:].strip()
-        
-        # msgctxt
-        if line.startswith('msgctxt'):
-            match = re.match(r'msgctxt\s+"(.*)"', line)
-            if match:
-                current_entry.msgctxt = _unescape_string(match.group(1))
-                current_field = 'msgctxt'
-            continue
-        
-        # msgid
-        if line.startswith('msgid '):
-            match = re.match(r'msgid\s+"(.*)"', line)
-            if match:
-                current_entry.msgid = _unescape_string(match.group(1))
-                current_field = 'msgid'
-            continue
-        
-        # msgid_plural
-        if line.startswith('msgid_plural'):
-            match = re.match(r'msgid_plural\s+"(.*)"', line)
-            if match:
-                current_entry.msgid_plural = _unescape_string(match.group(1))
-                current_field = 'msgid_plural'
-            continue
-        
-        # msgstr (singular)
-        if line.startswith('msgstr '):
-            match = re.match(r'msgstr\s+"(.*)"', line)
-            if match:
-                current_entry.msgstr = _unescape_string(match.group(1))
-                current_field = 'msgstr'
-            continue
+    Args:
+        text_path (str): Path to the plain text file
         
-        # msgstr[n] (plural)
-        if line.startswith('msgstr['):
-            match = re.match(r'msgstr\[(\d+)\]\s+"(.*)"', line)
-            if match:
-                idx = int(match.group(1))
-                current_entry.msgstr_plural[idx] = _unescape_string(match.group(2))
-                current_field = f'msgstr[{idx}]'
-            continue
+    Yields:
+        str: The decoded text between two entry separators
+    """
+    with open(text_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap cannot map an empty file
         
-        # Continuation line (quoted string)
-        if line.startswith('"') and current_field:
-            match = re.match(r'"(.*)"', line)
-            if match:
-                continuation = _unescape_string(match.group(1))
-                
-                if current_field == 'msgctxt':
-                    current_entry.msgctxt += continuation
-                elif current_field == 'msgid':
-                    current_entry.msgid += continuation
-                elif current_field == 'msgid_plural':
-                    current_entry.msgid_plural += continuation
-                elif current_field == 'msgstr':
-                    current_entry.msgstr += continuation
-                elif current_field.startswith('msgstr['):
-                    idx = int(current_field[7:-1])
-                    current_entry.msgstr_plural[idx] += continuation
-    
-    # Don't forget the last entry
-    if current_entry.msgid is not None:
-        entries.append(current_entry)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = None
+            for boundary in _RE_BLOCK_BOUNDARY.finditer(mm):
+                if start is not None:
+                    yield mm[start:boundary.start()].decode('utf-8')
+                start = boundary.end()
+            if start is not None:
+                yield mm[start:].decode('utf-8')
+
+
+def _entry_key(msgctxt: Optional[str], msgid: str) -> Tuple[Optional[str], str]:
+    """
+    Build the (msgctxt, msgid) lookup key with interned strings.
     
-    return entries
+    Interned keys cache their hash, which keeps repeated set and dict probes
+    cheap for long msgids. A missing context stays None, so it
+    remains distinct from an empty one.
+    """
+    return (sys.intern(msgctxt) if msgctxt is not None else None, sys.intern(msgid))
 
 
-def _unescape_string(s: str) -> str:
+def _from_polib_entry(po_entry: polib.POEntry) -> POEntry:
     """
-    Unescape a string from PO file format.
+    Convert a polib entry into a POEntry.
     
     Args:
-        s (str): Escaped string
+        po_entry (polib.POEntry): Entry parsed by polib
         
     Returns:
-        str: Unescaped string
+        POEntry: The equivalent entry
     """
-    # Replace escape sequences
-    s = s.replace('\\n', '\n')
-    s = s.replace('\\t', '\t')
-    s = s.replace('\\r', '\r')
-    s = s.replace('\\"', '"')
-    s = s.replace('\\\\', '\\')
-    
-    return s
+    return POEntry(
+        msgctxt=po_entry.msgctxt,
+        msgid=po_entry.msgid,
+        msgid_plural=po_entry.msgid_plural or None,
+        msgstr=po_entry.msgstr,
+        msgstr_plural=dict(po_entry.msgstr_plural),
+        comments=po_entry.tcomment.splitlines() if po_entry.tcomment else [],
+        extracted_comments=po_entry.comment.splitlines() if po_entry.comment else [],
+        references=[
+            f"{path}:{line}" if line else path for path, line in po_entry.occurrences
+        ],
+        flags=list(po_entry.flags),
+        previous_msgid=po_entry.previous_msgid,
+        obsolete=bool(po_entry.obsolete),
+    )
 
 
 # Example usage
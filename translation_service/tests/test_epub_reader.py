@@ -0,0 +1,50 @@
+import io
+import os
+import sys
+import unittest
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from epub_reader import EPUBHandler  # noqa: E402
+
+_XHTML11_DOCTYPE = (
+    b'<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" '
+    b'"http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">'
+)
+
+
+def _archive(name: str, content: bytes) -> zipfile.ZipFile:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as epub_zip:
+        epub_zip.writestr(name, content)
+    return zipfile.ZipFile(buf)
+
+
+def _chapter(body: bytes, doctype: bytes = b'') -> bytes:
+    return (
+        b'<?xml version="1.0" encoding="utf-8"?>' + doctype +
+        b'<html xmlns="http://www.w3.org/1999/xhtml"><body>' + body + b'</body></html>'
+    )
+
+
+class ExtractTextFromXhtmlTest(unittest.TestCase):
+
+    def _extract(self, content: bytes) -> str:
+        return EPUBHandler._extract_text_from_xhtml(_archive('chapter.xhtml', content), 'chapter.xhtml')
+
+    def test_plain_chapter(self):
+        self.assertEqual(self._extract(_chapter(b'<p>Hello world</p>')), 'Hello world')
+
+    def test_html_entities_without_doctype(self):
+        text = self._extract(_chapter(b'<p>Hello&nbsp;world &mdash; end</p>'))
+        self.assertEqual(text, 'Hello world — end')
+
+    def test_html_entities_with_xhtml11_doctype(self):
+        # libxml2 reports undeclared entities as warnings when a DTD is declared
+        text = self._extract(_chapter(b'<p>Hello&nbsp;world &mdash; end</p>', _XHTML11_DOCTYPE))
+        self.assertEqual(text, 'Hello world — end')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import polib  # noqa: E402
+
+from po_reader import (  # noqa: E402
+    assemble_po_from_text,
+    is_untranslatable,
+    passthrough_translation,
+    read_po_to_text,
+)
+
+_SEP = "-" * 80
+
+_PO_HEADER = 'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n\n'
+
+# A last entry with words, so the entries under test are never the final one
+_LAST_ENTRY = 'msgid "Goodbye"\nmsgstr ""\n'
+
+
+class PassthroughTranslationTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _po_path(self, entries: str) -> str:
+        path = os.path.join(self._tmp.name, "messages.po")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_PO_HEADER + entries + "\n" + _LAST_ENTRY)
+        return path
+
+    def _entry_blocks(self, po_path: str) -> list:
+        """The text's entry blocks, each starting with its separator line."""
+        text = read_po_to_text(po_path)
+        return [_SEP + block for block in text.split(_SEP)[1:] if block.strip().startswith("[Entry")]
+
+    def test_untranslatable_strings(self):
+        for text in ("", "  ", "42", "%s", "%1$d / %2$d", "%(name)s:", "{0}", "{{count}} / {total}"):
+            self.assertTrue(is_untranslatable(text), text)
+        for text in ("Hello", "%d file", "{count} items"):
+            self.assertFalse(is_untranslatable(text), text)
+
+    def test_fills_untranslatable_entries(self):
+        po_path = self._po_path('msgid "%s"\nmsgstr ""\n\nmsgid "42"\nmsgstr ""\n')
+        chunk = "".join(self._entry_blocks(po_path)[:2])
+
+        result = passthrough_translation(chunk)
+
+        self.assertIsNotNone(result)
+        self.assertIn("Original:\n%s\n\nTranslation:\n%s\n\n", result)
+        self.assertIn("Original:\n42\n\nTranslation:\n42\n\n", result)
+
+        # The filled chunk reassembles into msgstr == msgid
+        text_path = os.path.join(self._tmp.name, "translated.txt")
+        with open(text_path, "w", encoding="utf-8") as f:
+            f.write(result)
+        output_path = os.path.join(self._tmp.name, "assembled.po")
+        assemble_po_from_text(text_path, po_path, output_path)
+        translations = {entry.msgid: entry.msgstr for entry in polib.pofile(output_path)}
+        self.assertEqual(translations["%s"], "%s")
+        self.assertEqual(translations["42"], "42")
+
+    def test_rejects_translatable_entry(self):
+        po_path = self._po_path('msgid "%s"\nmsgstr ""\n\nmsgid "Hello"\nmsgstr ""\n')
+        chunk = "".join(self._entry_blocks(po_path)[:2])
+
+        self.assertIsNone(passthrough_translation(chunk))
+
+    def test_rejects_block_cut_after_translation_header(self):
+        po_path = self._po_path('msgid "%s"\nmsgstr ""\n')
+        block = self._entry_blocks(po_path)[0]
+        cut = block[:block.index("Translation:\n") + len("Translation:\n")]
+
+        self.assertIsNone(passthrough_translation(cut))
+
+    def test_rejects_block_cut_before_blank_line(self):
+        po_path = self._po_path('msgid "%s"\nmsgstr ""\n')
+        block = self._entry_blocks(po_path)[0]
+
+        self.assertIsNone(passthrough_translation(block.rstrip("\n") + "\n"))
+
+    def test_rejects_chunk_starting_mid_entry(self):
+        po_path = self._po_path('msgid "%s"\nmsgstr ""\n\nmsgid "42"\nmsgstr ""\n')
+        first, second = self._entry_blocks(po_path)[:2]
+        tail = first[first.index("Translation:"):]
+
+        self.assertIsNone(passthrough_translation(tail + second))
+
+    def test_fills_plural_forms(self):
+        po_path = self._po_path(
+            'msgid "%d"\nmsgid_plural "%d+"\nmsgstr[0] ""\nmsgstr[1] ""\n'
+        )
+        block = self._entry_blocks(po_path)[0]
+
+        result = passthrough_translation(block)
+
+        self.assertIsNotNone(result)
+        self.assertIn("Translation:\n  [Plural form 0]: %d\n  [Plural form 1]: %d+\n\n", result)
+
+    def test_keeps_existing_translations(self):
+        po_path = self._po_path(
+            'msgid "42"\nmsgstr "٤٢"\n\n'
+            'msgid "%d"\nmsgid_plural "%d+"\nmsgstr[0] "%d!"\nmsgstr[1] ""\n'
+        )
+        blocks = self._entry_blocks(po_path)[:2]
+        self.assertIn("[TRANSLATED]", blocks[0])
+
+        result = passthrough_translation("".join(blocks))
+
+        self.assertIsNotNone(result)
+        self.assertIn("Original:\n42\n\nTranslation:\n٤٢\n\n", result)
+        self.assertIn("  [Plural form 0]: %d!\n  [Plural form 1]: %d+\n\n", result)
+
+
+if __name__ == '__main__':
+    unittest.main()
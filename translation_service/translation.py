@@ -20,8 +20,7 @@ GCS Folder Structure:
     ├── entity_extraction.txt          # Extracted entities and glossary
     ├── style_instructions.txt         # Extracted style guidelines
     ├── original_chunks/               # Source text chunks
-    │   ├── original_chunk_0001.txt
-    │   └── ...
+    │   └── original_chunks.ndjson     # One {"index", "content"} object per line
     ├── prompts_for_translation/       # Translation prompts with context
     │   ├── translation_prompt_chunk_0001.txt
     │   └── ...
@@ -35,21 +34,36 @@ Version: 2.0
 
 import os
 import argparse
+import asyncio
+import bisect
 import re
 import uuid
 import logging
+import math
 import mimetypes
+import mmap
 import secrets
 import datetime
+import functools
+import gzip
+import hashlib
+import io
+import json
 import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Callable, Iterable, Iterator, Tuple
 from dataclasses import dataclass
 
+import requests
+
 # Google Cloud imports
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 import vertexai
 from vertexai import agent_engines
 
@@ -67,7 +81,7 @@ from prompts import (
 import translation_config
  
 # Import readers for reference, but logic will be in-class
-from po_reader import read_po_to_text, assemble_po_from_text
+from po_reader import read_po_to_text, assemble_po_from_text, passthrough_translation
 
 # ============================================================================
 # GLOBAL INITIALIZATION
@@ -76,14 +90,34 @@ from po_reader import read_po_to_text, assemble_po_from_text
 # Set up a module-level logger
 logger = logging.getLogger(__name__)
 
-# Initialize Vertex AI and connect to the deployed agent once at module load
+# Splits a gs://bucket/path URI into bucket and blob name
+_GCS_URI_RE = re.compile(r"gs://([^/]+)/(.+)")
+
 if not translation_config.PROJECT_ID or not translation_config.LOCATION or not translation_config.AGENT_ENGINE_ID:
     raise ValueError(
         "PROJECT_ID, LOCATION, and AGENT_ENGINE_ID must be set in the environment."
     )
-print (translation_config.PROJECT_ID, translation_config.LOCATION, translation_config.AGENT_ENGINE_ID)
-vertexai.init(project=translation_config.PROJECT_ID, location=translation_config.LOCATION)
-_remote_agent_app = agent_engines.get(translation_config.AGENT_ENGINE_ID)
+
+# The deployed agent is connected on first use rather than at import, so
+# processes that import this module (e.g. spawned EPUB parsing workers)
+# open no gRPC channels
+_remote_agent_app = None
+_remote_agent_lock = threading.Lock()
+
+
+def _get_remote_agent():
+    """Returns the deployed validation agent, initializing Vertex AI on first use."""
+    global _remote_agent_app
+    if _remote_agent_app is None:
+        with _remote_agent_lock:
+            if _remote_agent_app is None:
+                logger.debug(
+                    f"Connecting to agent engine {translation_config.AGENT_ENGINE_ID} "
+                    f"in {translation_config.PROJECT_ID}/{translation_config.LOCATION}"
+                )
+                vertexai.init(project=translation_config.PROJECT_ID, location=translation_config.LOCATION)
+                _remote_agent_app = agent_engines.get(translation_config.AGENT_ENGINE_ID)
+    return _remote_agent_app
 
 
 # ============================================================================
@@ -120,6 +154,13 @@ class TranslationConfig:
         max_number_of_chunks: Optional limit on the number of chunks to process
         model: Gemini model to use
         temperature: Sampling temperature for generation
+        use_llm_cache: Reuse Gemini responses for identical translation
+                       requests, and agent validations for identical
+                       translations, cached in the GCS bucket
+        archive_original_chunks: Upload the original chunks to GCS (in the
+                                 background, while prompts are created)
+        bundle_original_chunks: Upload original chunks as a single NDJSON blob
+                                instead of one text blob per chunk
     """
     source_file: str
     target_language: str
@@ -131,6 +172,9 @@ class TranslationConfig:
     temperature: float = translation_config.TranslationDefaults.TEMPERATURE
     use_agent_validation: bool = True
     model: str = translation_config.TranslationDefaults.MODEL
+    use_llm_cache: bool = True
+    archive_original_chunks: bool = True
+    bundle_original_chunks: bool = True
 
 
 
@@ -182,7 +226,8 @@ def validate_translation_with_agent(
         # Generate unique user_id for session isolation
         user_id = f"validation_user_{secrets.token_hex(translation_config.Session.VALIDATION_USER_ID_BYTES)}" # type: ignore
         # Create a new agent session
-        remote_session_response = _remote_agent_app.create_session(user_id=user_id)
+        remote_agent = _get_remote_agent()
+        remote_session_response = remote_agent.create_session(user_id=user_id)
         session_id = remote_session_response["id"]
 
         # Construct validation prompt
@@ -192,9 +237,9 @@ def validate_translation_with_agent(
             f"Translated file: {translated_url}"
         )
 
-        # Stream agent response
-        response_text = ""
-        for event in _remote_agent_app.stream_query(
+        # Stream agent response; parts are joined once the stream ends
+        response_parts: List[str] = []
+        for event in remote_agent.stream_query(
             user_id=user_id,
             session_id=session_id,
             message=validation_prompt
@@ -203,7 +248,8 @@ def validate_translation_with_agent(
             if 'content' in event and 'parts' in event['content']:
                 for part in event['content']['parts']:
                     if 'text' in part:
-                        response_text += part['text']
+                        response_parts.append(part['text'])
+        response_text = ''.join(response_parts)
 
         logger.info(f"Validation completed successfully for: {translated_url}")
         return {'output': response_text}
@@ -213,6 +259,7 @@ def validate_translation_with_agent(
         error_msg = f"Agent validation failed: {str(e)}"
         raise Exception(error_msg) from e
 
+
 # ============================================================================
 # CORE CLASSES
 # ============================================================================
@@ -235,6 +282,89 @@ class GeminiClient:
         self.model = model
         self.client = genai.Client(vertexai=True)
     
+    @staticmethod
+    def _tools() -> List[types.Tool]:
+        return [types.Tool(google_search=types.GoogleSearch())]
+
+    def _generation_config(
+        self,
+        temperature: float,
+        cached_content: Optional[str] = None
+    ) -> types.GenerateContentConfig:
+        """
+        Build the request config shared by the sync and async generators.
+
+        Tools cannot be set on a request that uses a context cache, so they are
+        stored in the cache instead (see `create_context_cache`).
+        """
+        return types.GenerateContentConfig(
+            cached_content=cached_content,
+            temperature=temperature,
+            top_p=1.0,
+            max_output_tokens=translation_config.GeminiLimits.MAX_OUTPUT_TOKENS,
+            safety_settings=[
+                types.SafetySetting(category=cat, threshold="OFF")
+                for cat in [
+                    "HARM_CATEGORY_HATE_SPEECH",
+                    "HARM_CATEGORY_DANGEROUS_CONTENT",
+                    "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+                    "HARM_CATEGORY_HARASSMENT"
+                ]
+            ],
+            tools=None if cached_content else self._tools(),
+            thinking_config=types.ThinkingConfig(thinking_budget=-1)
+        )
+
+    def create_context_cache(self, preamble: str) -> str:
+        """
+        Cache a prompt prefix shared by many requests.
+
+        Requests that pass the returned name as `cached_content` send only
+        the text that follows the prefix, and the cached tokens are billed
+        at the reduced cached rate.
+
+        Args:
+            preamble: Prompt text common to all requests
+
+        Returns:
+            The resource name of the cached content
+
+        Raises:
+            errors.APIError: If the cache cannot be created (e.g. the preamble
+                             is below the model's minimum cacheable size)
+        """
+        cache = self.client.caches.create(
+            model=self.model,
+            config=types.CreateCachedContentConfig(
+                contents=self._user_contents(preamble),
+                tools=self._tools(),
+                ttl=f"{translation_config.GeminiLimits.CONTEXT_CACHE_TTL_SECONDS}s"
+            )
+        )
+        return cache.name
+
+    def extend_context_cache(self, name: str) -> None:
+        """Reset the TTL of cached content created by `create_context_cache`."""
+        self.client.caches.update(
+            name=name,
+            config=types.UpdateCachedContentConfig(
+                ttl=f"{translation_config.GeminiLimits.CONTEXT_CACHE_TTL_SECONDS}s"
+            )
+        )
+
+    def delete_context_cache(self, name: str) -> None:
+        """Delete cached content created by `create_context_cache`."""
+        self.client.caches.delete(name=name)
+
+    @staticmethod
+    def _user_contents(prompt: str) -> List[types.Content]:
+        return [
+            types.Content(
+                role="user",
+                parts=[types.Part(text=prompt)]
+            )
+        ]
+
     def generate(
         self,
         prompt: str,
@@ -256,40 +386,88 @@ class GeminiClient:
         Raises:
             Exception: If generation fails or API error occurs
         """
-        contents = [
-            types.Content(
-                role="user",
-                parts=[types.Part(text=prompt)]
-            )
-        ]
-        
-        generation_config = types.GenerateContentConfig(
-            temperature=temperature,
-            top_p=1.0,
-            max_output_tokens=translation_config.GeminiLimits.MAX_OUTPUT_TOKENS,
-            safety_settings=[
-                types.SafetySetting(category=cat, threshold="OFF")
-                for cat in [
-                    "HARM_CATEGORY_HATE_SPEECH",
-                    "HARM_CATEGORY_DANGEROUS_CONTENT",
-                    "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                    "HARM_CATEGORY_HARASSMENT"
-                ]
-            ],
-            tools=[types.Tool(google_search=types.GoogleSearch())],
-            thinking_config=types.ThinkingConfig(thinking_budget=-1)
-        )
-        
-        response_text = ""
+        # Streamed parts are joined once the stream ends
+        response_parts: List[str] = []
         for chunk in self.client.models.generate_content_stream(
             model=self.model,
-            contents=contents,
-            config=generation_config
+            contents=self._user_contents(prompt),
+            config=self._generation_config(temperature)
         ):
-            if chunk.candidates and chunk.candidates[0].content and chunk.candidates[0].content.parts:
-                response_text += chunk.text
+            # .text is None for chunks without candidates or parts
+            text = chunk.text
+            if text:
+                response_parts.append(text)
         
-        return response_text
+        return ''.join(response_parts)
+
+    async def generate_async(
+        self,
+        prompt: str,
+        temperature: float = 1.0,
+        cached_content: Optional[str] = None
+    ) -> str:
+        """
+        Generate content using the async Gemini API with streaming.
+
+        Uses the same configuration as `generate`. Rate-limit (429) and
+        server (5xx) errors are retried with exponential backoff.
+
+        Args:
+            prompt: Input prompt text for generation (only the part after the
+                    cached prefix when `cached_content` is given)
+            temperature: Sampling temperature (0.0-2.0, default: 1.0)
+            cached_content: Optional context cache name from `create_context_cache`
+
+        Returns:
+            Generated text response as a complete string
+
+        Raises:
+            errors.APIError: If generation still fails after all retries
+        """
+        limits = translation_config.GeminiLimits
+        for attempt in range(limits.MAX_RETRIES + 1):
+            try:
+                response_parts: List[str] = []
+                async for chunk in await self.client.aio.models.generate_content_stream(
+                    model=self.model,
+                    contents=self._user_contents(prompt),
+                    config=self._generation_config(temperature, cached_content)
+                ):
+                    text = chunk.text
+                    if text:
+                        response_parts.append(text)
+                return ''.join(response_parts)
+            except errors.APIError as e:
+                retryable = e.code == 429 or e.code >= 500
+                if not retryable or attempt == limits.MAX_RETRIES:
+                    raise
+                delay = limits.RETRY_BASE_DELAY_SECONDS * 2 ** attempt
+                logger.warning(f"Gemini request failed ({e.code}); retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+
+
+def create_storage_client() -> storage.Client:
+    """
+    Create a storage client whose connection pool fits concurrent transfers.
+
+    The default HTTP adapter keeps 10 connections per host, fewer than the
+    upload thread pool uses. Create one client per process and pass it to
+    every GCSManager to share the pool.
+
+    Returns:
+        A new `storage.Client`
+    """
+    client = storage.Client()
+    pool_size = translation_config.GCSConstants.HTTP_POOL_SIZE
+    # storage.Client exposes no pool-size option; `_http` is the requests
+    # session (an AuthorizedSession) every API call goes through, so the
+    # larger adapter is mounted on it directly.
+    client._http.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    )
+    return client
+
 
 class GCSManager:
     """
@@ -299,18 +477,29 @@ class GCSManager:
     generation, and blob listing operations.
     """
 
-    def __init__(self, bucket_name: str, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        bucket_name: str,
+        logger: Optional[logging.Logger] = None,
+        storage_client: Optional[storage.Client] = None
+    ):
         """
         Initialize GCS manager.
 
         Args:
             bucket_name: Name of the GCS bucket to use
             logger: Optional logger instance to use for logging.
+            storage_client: Optional client to share, so that several managers
+                            reuse one HTTP connection pool. A new client with a
+                            pool sized for concurrent transfers is created if omitted.
         """
-        self.client = storage.Client()
+        self.client = storage_client or create_storage_client()
         self.logger = logger or logging.getLogger(__name__)
         self.bucket_name = bucket_name
         self.bucket = self.client.bucket(bucket_name)
+        # (blob_path, expiration_minutes) -> (signed_url, refresh_after)
+        self._signed_urls: Dict[Tuple[str, int], Tuple[str, float]] = {}
+        self._signed_urls_lock = threading.Lock()
     
     def download_file(self, gcs_uri: str, destination_dir: Optional[str] = None) -> str:
         """
@@ -320,9 +509,8 @@ class GCSManager:
 
         Args:
             gcs_uri: GCS URI (gs://bucket/path) or local file path
-            destination: Local destination folder. NOTE: In a production environment, 
-                         it is recommended to use a temporary directory created with 
-                         the `tempfile` module instead of a hardcoded path.
+            destination_dir: Local destination folder (default: the platform
+                             temp directory)
 
         Returns:
             Local file path to the downloaded file
@@ -333,7 +521,7 @@ class GCSManager:
         if not gcs_uri.startswith("gs://"):
             return gcs_uri
 
-        match = re.match(r"gs://([^/]+)/(.+)", gcs_uri)
+        match = _GCS_URI_RE.match(gcs_uri)
         if not match:
             raise ValueError(f"Invalid GCS URI format: {gcs_uri}")
 
@@ -345,15 +533,46 @@ class GCSManager:
             destination_dir = tempfile.gettempdir()
 
         local_path = os.path.join(destination_dir, os.path.basename(blob_name))
-        blob.download_to_filename(local_path)
+
+        # Large objects are fetched as concurrent range requests
+        blob.reload()
+        if blob.size and blob.size > translation_config.GCSConstants.PARALLEL_DOWNLOAD_THRESHOLD_BYTES:
+            self.logger.info(f"Downloading {gcs_uri} ({blob.size} bytes) in parallel chunks")
+            transfer_manager.download_chunks_concurrently(
+                blob,
+                local_path,
+                chunk_size=translation_config.GCSConstants.DOWNLOAD_CHUNK_SIZE_BYTES,
+                # Range GETs are I/O-bound; the default process workers would
+                # fork this process and its open gRPC channels
+                worker_type=transfer_manager.THREAD,
+                max_workers=translation_config.Concurrency.DOWNLOAD_MAX_WORKERS
+            )
+        else:
+            blob.download_to_filename(local_path)
 
         return local_path
     
+    @staticmethod
+    def _text_content_type(blob_path: str) -> str:
+        """Return the content type for text stored at blob_path."""
+        if blob_path.endswith('.po'):
+            return 'text/x-gettext-translation'
+        return 'text/plain'
+
+    def _upload_blob(self, blob_path: str) -> storage.Blob:
+        """Return a blob handle configured for chunked resumable uploads."""
+        return self.bucket.blob(
+            blob_path,
+            chunk_size=translation_config.GCSConstants.UPLOAD_CHUNK_SIZE_BYTES
+        )
+
     def upload(
         self,
         blob_path: str,
         content: Optional[str] = None,
-        local_path: Optional[str] = None
+        local_path: Optional[str] = None,
+        compress: bool = False,
+        metadata: Optional[Dict[str, str]] = None
     ) -> str:
         """
         Uploads content or a local file to GCS.
@@ -364,6 +583,11 @@ class GCSManager:
             blob_path: Target blob path in the bucket.
             content: Text content to upload
             local_path: Path to the local file to upload.
+            compress: Gzip 'content' before sending it and store it with
+                      Content-Encoding: gzip. Readers using the storage client
+                      receive the decompressed text transparently. Content
+                      shorter than GCSConstants.GZIP_MIN_BYTES is sent as is.
+            metadata: Optional custom metadata to store on the blob.
 
         Returns:
             The GCS URI of the uploaded file.
@@ -376,22 +600,102 @@ class GCSManager:
             raise ValueError("Exactly one of 'content' or 'local_path' must be provided.")
 
         blob_path = blob_path.strip('/')
-        blob = self.bucket.blob(blob_path)
+        blob = self._upload_blob(blob_path)
+        if metadata:
+            blob.metadata = metadata
 
         if local_path:
-            content_type, _ = mimetypes.guess_type(local_path)
-            if content_type is None:
-                content_type = 'application/octet-stream'
+            content_type = _guess_content_type(Path(local_path).suffix.lower())
             blob.upload_from_filename(local_path, content_type=content_type)
         elif content is not None:
-            content_type = 'text/plain'
-            if blob_path.endswith('.po'):
-                content_type = 'text/x-gettext-translation'
-            blob.upload_from_string(content, content_type=content_type)
+            content_type = self._text_content_type(blob_path)
+            if compress and len(content) >= translation_config.GCSConstants.GZIP_MIN_BYTES:
+                blob.content_encoding = 'gzip'
+                data = gzip.compress(
+                    content.encode('utf-8'),
+                    compresslevel=translation_config.GCSConstants.GZIP_COMPRESS_LEVEL
+                )
+                blob.upload_from_string(data, content_type=f"{content_type}; charset=utf-8")
+            else:
+                blob.upload_from_string(content, content_type=content_type)
             
         return f"gs://{self.bucket_name}/{blob_path}"
 
+    def upload_many(
+        self,
+        items: Iterable[Tuple[str, str]],
+        max_workers: int = translation_config.Concurrency.UPLOAD_MAX_WORKERS,
+        compress: bool = False
+    ) -> List[str]:
+        """
+        Uploads many text blobs concurrently.
+
+        Small uploads are dominated by request latency, so they are issued from
+        a thread pool sharing this manager's client. Items are submitted as
+        they are produced, so a generator lets the first uploads start while
+        later contents are still being built.
+
+        Args:
+            items: (blob_path, content) pairs to upload
+            max_workers: Maximum number of uploads in flight
+            compress: Gzip each blob, as in `upload`
+
+        Returns:
+            The GCS URIs of the uploaded files, in input order.
+
+        Raises:
+            Exception: The first upload error, once all uploads have finished
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.upload, blob_path=blob_path, content=content, compress=compress)
+                for blob_path, content in items
+            ]
+        return [future.result() for future in futures]
+
+    def compose(self, sources: List[storage.Blob], blob_path: str) -> str:
+        """
+        Concatenate blobs server-side into a new text blob.
+
+        GCS composes at most 32 sources per request, so longer lists are
+        merged through temporary intermediate blobs, deleted afterwards.
+        Sources must be stored without a content encoding; gzip-encoded
+        members would be concatenated as compressed bytes.
 
+        Args:
+            sources: Blobs in this bucket, in output order
+            blob_path: Target blob path in the bucket
+
+        Returns:
+            The GCS URI of the composed blob.
+        """
+        blob_path = blob_path.strip('/')
+        limit = translation_config.GCSConstants.COMPOSE_MAX_SOURCES
+        intermediates: List[storage.Blob] = []
+        try:
+            while len(sources) > limit:
+                merged = []
+                for start in range(0, len(sources), limit):
+                    group = sources[start:start + limit]
+                    if len(group) == 1:
+                        merged.append(group[0])
+                        continue
+                    part = self.bucket.blob(f"{blob_path}.compose-{len(intermediates):04d}")
+                    part.compose(group)
+                    intermediates.append(part)
+                    merged.append(part)
+                sources = merged
+
+            destination = self.bucket.blob(blob_path)
+            destination.content_type = self._text_content_type(blob_path)
+            destination.compose(sources)
+        finally:
+            if intermediates:
+                with self.client.batch():
+                    for part in intermediates:
+                        part.delete()
+
+        return f"gs://{self.bucket_name}/{blob_path}"
 
     def generate_signed_url(
         self,
@@ -402,6 +706,9 @@ class GCSManager:
         Generate a temporary signed URL for blob access.
 
         Signed URLs allow temporary authenticated access without credentials.
+        A URL is reused for repeated requests until most of its lifetime has
+        elapsed, so callers always get at least the remaining fraction of
+        validity without paying for a new signature.
 
         Args:
             blob_path: Target blob path in bucket (e.g., 'folder/file.txt')
@@ -413,11 +720,22 @@ class GCSManager:
         Raises:
             Exception: If URL generation fails
         """
-        blob = self.bucket.blob(blob_path.strip('/'))
-        return blob.generate_signed_url(
+        blob_path = blob_path.strip('/')
+        key = (blob_path, expiration_minutes)
+        now = time.monotonic()
+        with self._signed_urls_lock:
+            cached = self._signed_urls.get(key)
+        if cached and now < cached[1]:
+            return cached[0]
+
+        url = self.bucket.blob(blob_path).generate_signed_url(
             version="v4",
             expiration=datetime.timedelta(minutes=expiration_minutes)
         )
+        refresh_after = now + expiration_minutes * 60 * translation_config.GCSConstants.SIGNED_URL_REUSE_FRACTION
+        with self._signed_urls_lock:
+            self._signed_urls[key] = (url, refresh_after)
+        return url
     
     def list_blobs(self, prefix: str) -> List[storage.Blob]:
         """
@@ -438,6 +756,9 @@ class GCSManager:
         """
         Count the number of blobs with a given prefix.
 
+        Only object names are requested, in the largest pages the API allows,
+        so counting costs one small response per thousand objects.
+
         Args:
             prefix: Blob path prefix (leading slashes are stripped)
 
@@ -445,9 +766,67 @@ class GCSManager:
             The number of blobs matching the prefix.
         """
         blobs = self.client.list_blobs(
-            self.bucket_name, prefix=prefix.strip('/')
+            self.bucket_name,
+            prefix=prefix.strip('/'),
+            page_size=translation_config.GCSConstants.LIST_PAGE_SIZE,
+            fields="items(name),nextPageToken"
         )
-        return sum(1 for _ in blobs)
+        for _ in blobs.pages:
+            pass
+        return blobs.num_results
+
+    def batch_exists(self, blob_paths: List[str]) -> Dict[str, bool]:
+        """
+        Check whether several blobs exist using batched requests.
+
+        The checks are sent through `client.batch()`, which packs up to 100
+        metadata calls into one HTTP request. Batching only applies to
+        metadata operations; uploads and downloads cannot be batched.
+
+        Args:
+            blob_paths: Blob paths in the bucket (leading slashes are stripped)
+
+        Returns:
+            Dictionary mapping each given blob path to whether it exists
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If a check fails
+                with anything other than 404 Not Found
+        """
+        batch_size = translation_config.GCSConstants.BATCH_MAX_REQUESTS
+        results: Dict[str, bool] = {}
+        for start in range(0, len(blob_paths), batch_size):
+            group = blob_paths[start:start + batch_size]
+            blobs = [self.bucket.blob(path.strip('/')) for path in group]
+            # With raise_exception=False every sub-response body, including
+            # error payloads, is stored as the blob's properties.
+            with self.client.batch(raise_exception=False):
+                for blob in blobs:
+                    blob.reload()
+            for path, blob in zip(group, blobs):
+                results[path] = self._batched_blob_exists(blob)
+        return results
+
+    @staticmethod
+    def _batched_blob_exists(blob: storage.Blob) -> bool:
+        """
+        Interpret a blob reloaded inside a non-raising batch.
+
+        Args:
+            blob: Blob whose properties hold its batch sub-response
+
+        Returns:
+            True if the blob was loaded, False if the check returned 404
+        """
+        if blob.generation is not None:
+            return True
+        properties = blob._properties if isinstance(blob._properties, dict) else {}
+        error = properties.get('error')
+        if isinstance(error, dict) and error.get('code') == 404:
+            return False
+        # Any other failure (403, 429, 5xx) is re-checked on its own, which
+        # returns False only on 404 and raises otherwise
+        return blob.exists()
 
     def read_blob_text(self, blob_path: str) -> str:
         """
@@ -463,7 +842,174 @@ class GCSManager:
             Exception: If blob doesn't exist or read fails
         """
         blob = self.bucket.blob(blob_path.strip('/'))
-        return blob.download_as_text()
+        return _download_utf8(blob)
+
+    def read_uri_text(self, gcs_uri: str) -> str:
+        """
+        Read text content from a full GCS URI, which may point to any bucket.
+
+        Args:
+            gcs_uri: GCS URI of the blob (gs://bucket/path)
+
+        Returns:
+            Text content as string
+
+        Raises:
+            ValueError: If GCS URI format is invalid
+        """
+        match = _GCS_URI_RE.match(gcs_uri)
+        if not match:
+            raise ValueError(f"Invalid GCS URI format: {gcs_uri}")
+
+        bucket_name, blob_name = match.groups()
+        return _download_utf8(self.client.bucket(bucket_name).blob(blob_name))
+
+
+class _GCSTTLCache:
+    """
+    Base for exact-match caches whose entries are GCS blobs under PREFIX.
+
+    Each entry carries an expiry time in its blob metadata; expired entries
+    are treated as absent.
+    """
+
+    PREFIX: str = ""
+
+    def __init__(
+        self,
+        gcs: GCSManager,
+        ttl_seconds: int = translation_config.LLMCache.TTL_SECONDS
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            gcs: GCS manager whose bucket holds the cache entries
+            ttl_seconds: How long an entry stays valid after it is written
+        """
+        self.gcs = gcs
+        self.ttl_seconds = ttl_seconds
+
+    @classmethod
+    def _blob_path(cls, key: str) -> str:
+        return f"{cls.PREFIX}/{key[:2]}/{key}.txt"
+
+    def _get_entry(self, key: str) -> Optional[storage.Blob]:
+        """Return the entry blob for a key, or None if absent or expired."""
+        blob = self.gcs.bucket.get_blob(self._blob_path(key))
+        if blob is None:
+            return None
+        expires_at = float((blob.metadata or {}).get('expires_at', 0))
+        if expires_at < time.time():
+            return None
+        return blob
+
+    def _entry_metadata(self) -> Dict[str, str]:
+        """Return the metadata for an entry written now."""
+        return {'expires_at': str(time.time() + self.ttl_seconds)}
+
+
+class GeminiCache(_GCSTTLCache):
+    """
+    Exact-match cache of Gemini responses, stored in GCS.
+
+    Entries are keyed by a SHA-256 of model, temperature and prompt, so a
+    re-run of a job with identical prompts reuses the earlier responses
+    instead of calling the model again.
+    """
+
+    PREFIX = translation_config.LLMCache.PREFIX
+
+    @staticmethod
+    def key(model: str, temperature: float, prompt: str) -> str:
+        """Return the cache key for a generation request."""
+        return hashlib.sha256(f"{model}|{temperature}|{prompt}".encode('utf-8')).hexdigest()
+
+    def lookup(self, key: str) -> Optional[str]:
+        """
+        Return the cached response for a key.
+
+        Args:
+            key: Cache key from `key`
+
+        Returns:
+            The cached response, or None if absent or expired
+        """
+        blob = self._get_entry(key)
+        if blob is None:
+            return None
+        return _download_utf8(blob)
+
+    def update(self, key: str, response: str) -> None:
+        """
+        Store a response under a key.
+
+        Args:
+            key: Cache key from `key`
+            response: Generated text to cache
+        """
+        self.gcs.upload(
+            blob_path=self._blob_path(key),
+            content=response,
+            compress=True,
+            metadata=self._entry_metadata()
+        )
+
+
+class ValidationCache(_GCSTTLCache):
+    """
+    Exact-match cache of agent-validated chunks, stored in GCS.
+
+    Entries are keyed by a SHA-256 of the translation prompt and the raw
+    translation. The value is a server-side copy of the final text the agent
+    saved, so a re-run that produces an identical translation restores the
+    validated chunk without calling the agent or moving the text through
+    this process.
+    """
+
+    PREFIX = translation_config.LLMCache.VALIDATION_PREFIX
+
+    @staticmethod
+    def key(prompt: str, translated: str) -> str:
+        """Return the cache key for validating a translation of a prompt."""
+        digest = hashlib.sha256(prompt.encode('utf-8'))
+        digest.update(b"\0")
+        digest.update(translated.encode('utf-8'))
+        return digest.hexdigest()
+
+    def restore(self, key: str, blob_path: str) -> bool:
+        """
+        Copy a cached validated chunk to blob_path.
+
+        Args:
+            key: Cache key from `key`
+            blob_path: Destination blob path in the bucket
+
+        Returns:
+            True if a valid entry was found and copied
+        """
+        cached = self._get_entry(key)
+        if cached is None:
+            return False
+        self.gcs.bucket.copy_blob(cached, self.gcs.bucket, blob_path)
+        return True
+
+    def store(self, key: str, blob_path: str) -> None:
+        """
+        Cache the validated chunk at blob_path, if the agent saved one.
+
+        Args:
+            key: Cache key from `key`
+            blob_path: Blob path the agent saved the validated chunk to
+        """
+        source = self.gcs.bucket.get_blob(blob_path)
+        if source is None:
+            return
+        entry = self.gcs.bucket.copy_blob(source, self.gcs.bucket, self._blob_path(key))
+        entry.metadata = self._entry_metadata()
+        entry.patch()
+
+
 class DocumentReader:
     """
     Reads and parses various document formats.
@@ -513,6 +1059,8 @@ class DocumentReader:
         Read plain text file with encoding detection.
 
         Attempts UTF-8 decoding first, falls back to Latin-1 if needed.
+        The file is memory-mapped and decoded in place, so no intermediate
+        bytes copy of the whole file is held alongside the decoded text.
 
         Args:
             file_path: Path to .txt file
@@ -521,12 +1069,13 @@ class DocumentReader:
             DocumentContent with extracted text
         """
         with open(file_path, 'rb') as f:
-            content = f.read()
-
-        try:
-            text = content.decode('utf-8')
-        except UnicodeDecodeError:
-            text = content.decode('latin-1')
+            if os.fstat(f.fileno()).st_size == 0:
+                return DocumentContent(text='', file_type='txt')
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                try:
+                    text = str(mm, 'utf-8')
+                except UnicodeDecodeError:
+                    text = str(mm, 'latin-1')
 
         return DocumentContent(text=text, file_type='txt')
     
@@ -605,6 +1154,13 @@ class ContextAwareChunker:
     This ensures translated chunks maintain natural reading flow and context.
     """
 
+    # Boundary kinds in priority order: paragraph, line, sentence, word.
+    # Zero-width lookahead matches allow overlapping hits ("\n\n\n" yields a
+    # paragraph break at each newline pair), as str.rfind would find them.
+    # A boundary's length equals the characters it keeps in the chunk.
+    _BOUNDARY_RE = re.compile(r'(?=(\n\n)|(\n)|([.!?][ \n])|( ))')
+    _BOUNDARY_ADVANCE = (2, 1, 2, 1)
+
     def __init__(self, max_chunk_size: int = 30000):
         """
         Initialize chunker.
@@ -624,20 +1180,59 @@ class ContextAwareChunker:
         Returns:
             List of text chunks
         """
+        return list(self.iter_chunks(text))
+
+    def iter_chunks(self, text: str) -> Iterator[str]:
+        """
+        Yield context-aware chunks one at a time.
+
+        Callers that only need a prefix of the document (e.g. when the
+        number of chunks is capped) stop before the rest is sliced.
+
+        Args:
+            text: Text to chunk
+
+        Yields:
+            Text chunks, in document order
+        """
         if len(text) <= self.max_chunk_size:
-            return [text]
+            yield text
+            return
         
-        chunks = []
+        boundaries = self._index_boundaries(text)
         position = 0
         
         while position < len(text):
-            chunk_end = self._find_chunk_boundary(text, position)
-            chunks.append(text[position:chunk_end])
+            chunk_end = self._find_chunk_boundary(text, position, boundaries)
+            yield text[position:chunk_end]
             position = chunk_end
-        
-        return chunks
+
+    def _index_boundaries(self, text: str) -> Tuple[List[int], ...]:
+        """
+        Collect the start offsets of every boundary kind in one pass.
+
+        Args:
+            text: Full text
+
+        Returns:
+            One sorted offset list per boundary kind, in priority order
+        """
+        boundaries = tuple([] for _ in self._BOUNDARY_ADVANCE)
+        paragraphs, lines = boundaries[0], boundaries[1]
+        for match in self._BOUNDARY_RE.finditer(text):
+            kind = match.lastindex - 1
+            boundaries[kind].append(match.start())
+            if kind == 0:
+                # A paragraph break is also a line break at the same offset
+                lines.append(match.start())
+        return boundaries
     
-    def _find_chunk_boundary(self, text: str, start: int) -> int:
+    def _find_chunk_boundary(
+        self,
+        text: str,
+        start: int,
+        boundaries: Tuple[List[int], ...]
+    ) -> int:
         """
         Find the optimal boundary for a chunk.
         
@@ -650,6 +1245,7 @@ class ContextAwareChunker:
         Args:
             text: Full text
             start: Starting position
+            boundaries: Offset lists from `_index_boundaries`
             
         Returns:
             End position for chunk
@@ -659,49 +1255,16 @@ class ContextAwareChunker:
         if ideal_end >= len(text):
             return len(text)
         
-        search_text = text[start:ideal_end]
         min_chunk_ratio = 0.7  # Minimum 70% of max size
-        min_position = int(self.max_chunk_size * min_chunk_ratio)
-        
-        boundary = self._find_last_occurrence(search_text, '\n\n', min_position)
-        if boundary >= 0:
-            return start + boundary + 2
-        
-        boundary = self._find_last_occurrence(search_text, '\n', min_position)
-        if boundary >= 0:
-            return start + boundary + 1
-        
-        sentence_endings = ['. ', '! ', '? ', '.\n', '!\n', '?\n']
-        best_boundary = -1
-        for ending in sentence_endings:
-            pos = self._find_last_occurrence(search_text, ending, min_position)
-            if pos > best_boundary:
-                best_boundary = pos
-        
-        if best_boundary >= 0:
-            return start + best_boundary + 2
-        
-        boundary = self._find_last_occurrence(search_text, ' ', min_position)
-        if boundary >= 0:
-            return start + boundary + 1
-        
+        min_position = start + int(self.max_chunk_size * min_chunk_ratio)
+
+        # The last boundary of each kind that ends within the window
+        for positions, advance in zip(boundaries, self._BOUNDARY_ADVANCE):
+            idx = bisect.bisect_right(positions, ideal_end - advance)
+            if idx and positions[idx - 1] >= min_position:
+                return positions[idx - 1] + advance
+
         return ideal_end
-    
-    @staticmethod
-    def _find_last_occurrence(text: str, pattern: str, min_pos: int) -> int:
-        """
-        Find last occurrence of pattern after minimum position.
-        
-        Args:
-            text: Text to search
-            pattern: Pattern to find
-            min_pos: Minimum position
-            
-        Returns:
-            Position of last occurrence, or -1 if not found
-        """
-        pos = text.rfind(pattern)
-        return pos if pos >= min_pos else -1
 
 class MetadataExtractor:
     """
@@ -768,6 +1331,11 @@ class TranslationPipeline:
         'epub': "EPUB ebook in HTML format. Preserve ALL HTML tags, attributes, and structure. Do not escape HTML entities. Maintain all formatting tags like <p>, <h1>, <div>, <em>, <strong>, etc."
     }
 
+    # Blob names of the per-chunk artifacts, formatted with the chunk index
+    PROMPT_BLOB_NAME = "translation_prompt_chunk_{:04d}.txt"
+    TRANSLATED_BLOB_NAME = "translated_chunk_{:04d}.txt"
+    FINAL_BLOB_NAME = "final_translated_chunk_{:04d}.txt"
+
     def __init__(self, config: TranslationConfig, gcs_manager: Optional[GCSManager] = None):
         """
         Initialize translation pipeline.
@@ -777,11 +1345,33 @@ class TranslationPipeline:
             gcs_manager: Optional GCSManager instance. If not provided, a new one will be created.
         """
         self.config = config
+        # Session folder without surrounding slashes, the prefix of every blob path
+        self._folder = config.gcs_folder.strip('/')
+        self._prompts_folder = f"{self._folder}/prompts_for_translation"
+        self._translated_folder = f"{self._folder}/translated_chunks"
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.gcs = gcs_manager or GCSManager(config.gcs_bucket, logger=self.logger)
         self.gemini = GeminiClient(config.model)
         self.chunker = ContextAwareChunker(config.max_chunk_size)
         self.extractor = MetadataExtractor(self.gemini)
+        self.llm_cache = GeminiCache(self.gcs) if config.use_llm_cache else None
+        self.validation_cache = ValidationCache(self.gcs) if config.use_llm_cache else None
+        # Indices of the chunks whose prompts were written by `_create_prompts`
+        self._chunk_indices: List[int] = []
+        # Translations of .po chunks that need no model call, by chunk index
+        self._passthrough_chunks: Dict[int, str] = {}
+        # Gemini requests of the current `_process_chunks` run, by GeminiCache key
+        self._generations: Dict[str, asyncio.Task] = {}
+        # Prompt text shared by all chunks, and its Gemini context cache
+        self._prompt_preamble: Optional[str] = None
+        self._context_cache: Optional[str] = None
+        self._archive_future: Optional[Future] = None
+        # Scratch directory for the current `execute` run
+        self._work_dir: Optional[str] = None
+        # Thread pools for blocking calls made by `_process_chunks`; agent
+        # validations get their own so they cannot starve GCS I/O
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self._validation_executor: Optional[ThreadPoolExecutor] = None
     
     def execute(
         self,
@@ -809,21 +1399,26 @@ class TranslationPipeline:
         Raises:
             Exception: If any step in the pipeline fails
         """
-        local_file = None
         try:
             self.logger.info(f"Starting translation for {self.config.source_file}")
             self.logger.info(f"Output will be saved to: gs://{self.config.gcs_bucket}/{self.config.gcs_folder}")
 
-            local_file, content = self._download_and_read_document()
-            file_type = content.file_type
+            # Downloads and intermediate files live in a per-run scratch
+            # directory under the platform temp location, removed on exit
+            with tempfile.TemporaryDirectory(prefix="translation_") as work_dir:
+                self._work_dir = work_dir
+
+                local_file, content = self._download_and_read_document()
+                file_type = content.file_type
 
-            metadata = self._handle_metadata(entity_content, style_content, content)
+                metadata = self._handle_metadata(entity_content, style_content, content)
 
-            num_prompts = self._chunk_and_create_prompts(content.text, file_type, metadata)
+                num_prompts = self._chunk_and_create_prompts(content.text, file_type, metadata)
 
-            num_translations = self._execute_and_validate_translations()
+                num_translations = self._execute_and_validate_translations()
 
-            self._reassemble_and_finalize(file_type, local_file)
+                self._reassemble_and_finalize(file_type, local_file)
+                self._wait_for_archive()
             
             return {
                 'success': True,
@@ -836,14 +1431,12 @@ class TranslationPipeline:
             self.logger.error(f"Translation pipeline failed: {e}", exc_info=True)
             raise
         finally:
-            # Cleanup temporary file
-            if local_file and self.config.source_file.startswith("gs://") and os.path.exists(local_file):
-                os.remove(local_file)
+            self._work_dir = None
 
     def _download_and_read_document(self) -> tuple[str, DocumentContent]:
         """Downloads the source file and returns its content."""
         self.logger.info(f"Downloading source file: {self.config.source_file}...")
-        local_file = self.gcs.download_file(self.config.source_file)
+        local_file = self.gcs.download_file(self.config.source_file, self._work_dir)
         self.logger.info("Source file downloaded.")
 
         self.logger.info("Reading and parsing document...")
@@ -855,22 +1448,28 @@ class TranslationPipeline:
         """Extracts or uses user-provided metadata and saves it to GCS."""
         entities = entity_content
         style = style_content
-
-        if not entities:
-            self.logger.info("Extracting entities from document...")
-            entities = self.extractor._extract_entities(
-                content.text[:self.config.metadata_preview_size],
-                self.config.target_language
-            )
-            self.logger.info("Entity extraction complete.")
-
-        if not style:
-            self.logger.info("Extracting style instructions from document...")
-            style = self.extractor._extract_style(
-                content.text[:self.config.metadata_preview_size],
-                self.config.target_language
-            )
-            self.logger.info("Style instruction extraction complete.")
+        preview = content.text[:self.config.metadata_preview_size]
+
+        # Both extractions are independent Gemini calls, so they run side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            entities_future = style_future = None
+            if not entities:
+                self.logger.info("Extracting entities from document...")
+                entities_future = executor.submit(
+                    self.extractor._extract_entities, preview, self.config.target_language
+                )
+            if not style:
+                self.logger.info("Extracting style instructions from document...")
+                style_future = executor.submit(
+                    self.extractor._extract_style, preview, self.config.target_language
+                )
+
+            if entities_future:
+                entities = entities_future.result()
+                self.logger.info("Entity extraction complete.")
+            if style_future:
+                style = style_future.result()
+                self.logger.info("Style instruction extraction complete.")
 
         self.logger.info("Saving metadata to GCS...")
         metadata = self._save_provided_metadata(entities, style, self.logger.info)
@@ -878,13 +1477,41 @@ class TranslationPipeline:
         return metadata
 
     def _chunk_and_create_prompts(self, text: str, file_type: str, metadata: Dict[str, str]) -> int:
-        """Chunks the document, uploads original chunks, and creates translation prompts."""
+        """
+        Chunks the document and creates translation prompts.
+
+        Chunks are streamed from the chunker into prompt building and upload.
+        Archiving the original chunks then runs in the background, alongside
+        the translations; `_wait_for_archive` joins it.
+        """
         self.logger.info("Chunking document and creating translation prompts...")
-        original_chunks = self._chunk_and_upload_original(text, self.logger.info)
-        num_prompts = self._create_prompts(original_chunks, file_type, metadata, self.logger.info)
+        original_chunks: List[DocumentChunk] = []
+
+        def recorded(chunks: Iterable[DocumentChunk]) -> Iterator[DocumentChunk]:
+            for chunk_obj in chunks:
+                original_chunks.append(chunk_obj)
+                yield chunk_obj
+
+        num_prompts = self._create_prompts(
+            recorded(self._iter_chunks(text, self.logger.info)), file_type, metadata, self.logger.info
+        )
+
+        if self.config.archive_original_chunks:
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._archive_future = executor.submit(
+                self._archive_chunks, original_chunks, self.logger.info
+            )
+            executor.shutdown(wait=False)
+
         self.logger.info(f"Created {num_prompts} prompt files.")
         return num_prompts
 
+    def _wait_for_archive(self) -> None:
+        """Wait for the background upload of original chunks, re-raising its error."""
+        if self._archive_future is not None:
+            future, self._archive_future = self._archive_future, None
+            future.result()
+
     def _execute_and_validate_translations(self) -> int:
         """Executes the translation and validation for each chunk."""
         self.logger.info("Starting translation of chunks...")
@@ -913,20 +1540,20 @@ class TranslationPipeline:
         """Reassemble PO file from translated text."""
         self.logger.info("  - Assembling final .po file from translated text...")
         try:
-            final_text_local_path = self.gcs.download_file(final_doc_path)
+            final_text_local_path = self.gcs.download_file(final_doc_path, self._work_dir)
             
             original_basename = os.path.basename(self.config.source_file)
             assembled_po_filename = f"assembled_{original_basename}"
-            assembled_po_local_path = os.path.join("/tmp", assembled_po_filename)
+            assembled_po_local_path = os.path.join(self._work_dir, assembled_po_filename)
 
             assemble_po_from_text(final_text_local_path, local_file, assembled_po_local_path)
             self.gcs.upload(
                 local_path=assembled_po_local_path,
-                blob_path=f"{self.config.gcs_folder.strip('/')}/{assembled_po_filename}"
+                blob_path=f"{self._folder}/{assembled_po_filename}"
             )
             self.logger.info(
                 f"  - Final .po file saved to GCS: "
-                f"{self.config.gcs_folder.strip('/')}/{assembled_po_filename}"
+                f"{self._folder}/{assembled_po_filename}"
             )
         except Exception as e:
             self.logger.warning(f"Failed to assemble .po file: {e}", exc_info=True)
@@ -949,7 +1576,7 @@ class TranslationPipeline:
             # Change the extension to .txt to reflect the new format
             assembled_filename = f"assembled_{Path(original_basename).stem}.txt"
             
-            final_blob_path = f"{self.config.gcs_folder.strip('/')}/{assembled_filename}"
+            final_blob_path = f"{self._folder}/{assembled_filename}"
             
             # Upload to GCS
             self.gcs.upload(
@@ -968,7 +1595,7 @@ class TranslationPipeline:
 
     def _save_provided_metadata(self, entity_content: str, style_content: str, status_callback: callable) -> Dict[str, str]:
         """Save user-provided metadata to GCS."""
-        folder = self.config.gcs_folder.strip('/')
+        folder = self._folder
 
         if entity_content:
             self.gcs.upload(
@@ -989,43 +1616,81 @@ class TranslationPipeline:
             'style': style_content
         }
     
-    def _chunk_and_upload_original(
+    def _iter_chunks(
         self,
         text: str,
         status_callback: Callable[[str], None]
-    ) -> List[DocumentChunk]:
+    ) -> Iterator[DocumentChunk]:
         """
-        Chunk original text and upload to GCS.
+        Chunk original text lazily, honouring `max_number_of_chunks`.
 
         Args:
             text: The text content to chunk.
             status_callback: Callback for progress updates
 
-        Returns:
-            List of DocumentChunk objects with GCS URIs
+        Yields:
+            DocumentChunk objects without GCS URIs
         """
-        chunks_text = self.chunker.chunk(text)
-
-        # Limit the number of chunks if max_number_of_chunks is set
-        if self.config.max_number_of_chunks and len(chunks_text) > self.config.max_number_of_chunks:
-            status_callback(f"  - Warning: Document was truncated to {self.config.max_number_of_chunks} chunks from {len(chunks_text)}.")
-            chunks_text = chunks_text[:self.config.max_number_of_chunks]
-
-        document_chunks = []
-        folder = f"{self.config.gcs_folder.strip('/')}/original_chunks"
+        max_chunks = self.config.max_number_of_chunks
+        for idx, chunk_content in enumerate(self.chunker.iter_chunks(text), start=1):
+            if max_chunks and idx > max_chunks:
+                # One chunk past the limit detects truncation without slicing
+                # the remainder of the document
+                estimated_total = math.ceil(len(text) / self.chunker.max_chunk_size)
+                status_callback(
+                    f"  - Warning: Document was truncated to {max_chunks} chunks "
+                    f"from about {estimated_total}."
+                )
+                return
+            yield DocumentChunk(index=idx, content=chunk_content)
+
+    def _archive_chunks(
+        self,
+        chunks: List[DocumentChunk],
+        status_callback: Callable[[str], None]
+    ) -> None:
+        """
+        Upload original chunks to GCS and record their URIs on the chunks.
 
-        for idx, chunk_content in enumerate(chunks_text, start=1):
-            status_callback(f"  - Uploading original chunk {idx}/{len(chunks_text)}...")
-            filename = f"original_chunk_{idx:04d}.txt"
-            gcs_uri = self.gcs.upload(blob_path=f"{folder}/{filename}", content=chunk_content)
-            doc_chunk = DocumentChunk(index=idx, content=chunk_content, gcs_uri=gcs_uri)
-            document_chunks.append(doc_chunk)
+        All chunks share the bundle's URI when `bundle_original_chunks` is set.
 
-        return document_chunks
+        Args:
+            chunks: Chunks from `_iter_chunks`
+            status_callback: Callback for progress updates
+        """
+        folder = f"{self._folder}/original_chunks"
+
+        if self.config.bundle_original_chunks:
+            # One NDJSON object ({"index": ..., "content": ...} per line) costs
+            # a single upload regardless of the number of chunks.
+            status_callback(f"  - Uploading {len(chunks)} original chunks as one bundle...")
+            buffer = io.StringIO()
+            for chunk_obj in chunks:
+                buffer.write(json.dumps(
+                    {"index": chunk_obj.index, "content": chunk_obj.content},
+                    ensure_ascii=False
+                ))
+                buffer.write("\n")
+            bundle_uri = self.gcs.upload(
+                blob_path=f"{folder}/original_chunks.ndjson",
+                content=buffer.getvalue(),
+                compress=True
+            )
+            for chunk_obj in chunks:
+                chunk_obj.gcs_uri = bundle_uri
+            return
+
+        status_callback(f"  - Uploading {len(chunks)} original chunks...")
+        gcs_uris = self.gcs.upload_many([
+            (f"{folder}/original_chunk_{chunk_obj.index:04d}.txt", chunk_obj.content)
+            for chunk_obj in chunks
+        ], compress=True)
+        for chunk_obj, gcs_uri in zip(chunks, gcs_uris):
+            chunk_obj.gcs_uri = gcs_uri
 
     def _create_prompts(
         self,
-        original_chunks: List[DocumentChunk],
+        original_chunks: Iterable[DocumentChunk],
         file_type: str,
         metadata: Dict[str, str],
         status_callback: Callable[[str], None]
@@ -1034,10 +1699,11 @@ class TranslationPipeline:
         Create translation prompt files for all chunks.
 
         Generates comprehensive prompts containing source text, entities,
-        style instructions, and context information.
+        style instructions, and context information. Chunks are consumed
+        lazily, so uploads start while later chunks are still being produced.
 
         Args:
-            original_chunks: List of document chunks
+            original_chunks: Document chunks, in order
             file_type: The file type of the original document (e.g., 'po', 'txt').
             metadata: Extracted entities and style instructions
             status_callback: Callback for progress updates
@@ -1045,42 +1711,62 @@ class TranslationPipeline:
         Returns:
             Number of prompts created
         """
-        folder = f"{self.config.gcs_folder.strip('/')}/prompts_for_translation"
+        folder = self._prompts_folder
         
         type_instruction = self.FILE_TYPE_INSTRUCTIONS.get(
             file_type,
             "Document content." # Default instruction
         )
         
-        for chunk_obj in original_chunks:
-            status_callback(f"  - Creating prompt for chunk {chunk_obj.index}/{len(original_chunks)}...")
-            prompt = self._build_prompt(
-                chunk=chunk_obj.content,
-                chunk_num=chunk_obj.index,
-                total_chunks=len(original_chunks),
-                type_instruction=type_instruction,
-                metadata=metadata
-            )
-            
-            filename = f"translation_prompt_chunk_{chunk_obj.index:04d}.txt"
-            self.gcs.upload(blob_path=f"{folder}/{filename}", content=prompt)
-            status_callback(f"  - Prompt for chunk {chunk_obj.index} saved to GCS.")
+        build_prompt = self._build_prompt
+        chunk_indices: List[int] = []
+        passthrough_chunks: Dict[int, str] = {}
+
+        def prompt_items() -> Iterator[Tuple[str, str]]:
+            for chunk_obj in original_chunks:
+                chunk_indices.append(chunk_obj.index)
+                if file_type == 'po':
+                    translated = passthrough_translation(chunk_obj.content)
+                    if translated is not None:
+                        passthrough_chunks[chunk_obj.index] = translated
+                yield (
+                    f"{folder}/{self.PROMPT_BLOB_NAME.format(chunk_obj.index)}",
+                    build_prompt(
+                        chunk=chunk_obj.content,
+                        type_instruction=type_instruction,
+                        metadata=metadata
+                    )
+                )
+
+        status_callback("  - Creating prompts...")
+        self.gcs.upload_many(prompt_items(), compress=True)
+        self._chunk_indices = chunk_indices
+        self._passthrough_chunks = passthrough_chunks
+        self._prompt_preamble = self._build_prompt_preamble(type_instruction, metadata)
+        total = len(chunk_indices)
+        status_callback(f"  - Prompts for {total} chunks saved to GCS.")
         
-        return len(original_chunks)
+        return total
 
     
+    def _build_prompt_preamble(self, type_instruction: str, metadata: Dict[str, str]) -> str:
+        """Build the part of every prompt that precedes the chunk text."""
+        template_head = TRANSLATION_PROMPT_TEMPLATE.split("{chunk}", 1)[0]
+        return template_head.format(
+            target_language=self.config.target_language,
+            type_instruction=type_instruction,
+            entities=metadata['entities'],
+            style=metadata['style']
+        )
+
     def _build_prompt(
         self,
         chunk: str,
-        chunk_num: int,
-        total_chunks: int,
         type_instruction: str,
         metadata: Dict[str, str]
     ) -> str:
         """Build translation prompt."""
         return TRANSLATION_PROMPT_TEMPLATE.format(
-            chunk_num=chunk_num,
-            total_chunks=total_chunks,
             target_language=self.config.target_language,
             type_instruction=type_instruction,
             entities=metadata['entities'],
@@ -1095,8 +1781,8 @@ class TranslationPipeline:
         """
         Execute translations and validations for all prompts.
 
-        For each chunk:
-        1. Translates using Gemini API
+        Chunks are processed concurrently. For each chunk:
+        1. Translates using the async Gemini API
         2. Uploads translation to GCS
         3. Validates translation using ADK Agent
 
@@ -1109,89 +1795,270 @@ class TranslationPipeline:
         Raises:
             Exception: If translation generation fails (validation errors are logged but don't fail)
         """
-        prompts_folder = f"{self.config.gcs_folder.strip('/')}/prompts_for_translation/"
-        translated_folder = f"{self.config.gcs_folder.strip('/')}/translated_chunks/"
+        if not self._chunk_indices:
+            return 0
 
-        prompt_blobs = self.gcs.list_blobs(prompts_folder)
+        status_callback(f"  - Translating {len(self._chunk_indices)} chunks...")
+        # Kept apart from _context_cache, which is cleared if the cache fails
+        cache_name = self._context_cache = self._create_context_cache()
+        concurrency = translation_config.Concurrency
+        self._io_executor = ThreadPoolExecutor(max_workers=concurrency.UPLOAD_MAX_WORKERS)
+        self._validation_executor = ThreadPoolExecutor(max_workers=concurrency.VALIDATION_MAX_WORKERS)
+        try:
+            asyncio.run(self._process_chunks(status_callback))
+        finally:
+            self._io_executor.shutdown()
+            self._validation_executor.shutdown()
+            self._io_executor = self._validation_executor = None
+            self._context_cache = None
+            if cache_name:
+                try:
+                    self.gemini.delete_context_cache(cache_name)
+                except Exception as e:
+                    self.logger.warning(f"Failed to delete Gemini context cache: {e}")
 
-        if not prompt_blobs:
-            return 0
+        return len(self._chunk_indices)
 
-        # Sort blobs to process them in order
-        prompt_blobs = sorted(prompt_blobs, key=lambda b: b.name)
+    def _create_context_cache(self) -> Optional[str]:
+        """
+        Cache the shared prompt preamble for this job's Gemini requests.
 
-        for idx, prompt_blob in enumerate(prompt_blobs, start=1):
-            # Step 1: Translate
-            status_callback(f"  - Translating chunk {idx}/{len(prompt_blobs)}...")
-            prompt_content = prompt_blob.download_as_text()
-            translated = self.gemini.generate(prompt_content, self.config.temperature)
+        Returns:
+            The context cache name, or None if caching is unavailable (e.g. the
+            preamble is too short to cache), in which case full prompts are sent
+        """
+        if not self._prompt_preamble:
+            return None
+        try:
+            cache_name = self.gemini.create_context_cache(self._prompt_preamble)
+        except Exception as e:
+            self.logger.info(f"Gemini context cache not used: {e}")
+            return None
+        self.logger.info(f"Created Gemini context cache {cache_name}")
+        return cache_name
 
-            translated_filename = os.path.basename(prompt_blob.name).replace(
-                'translation_prompt_',
-                'translated_'
-            )
+    async def _process_chunks(self, status_callback: Callable[[str], None]) -> None:
+        """
+        Translate and validate every chunk concurrently.
 
-            translated_blob_path = f"{translated_folder}{translated_filename}"
-            self.gcs.upload(blob_path=translated_blob_path, content=translated)
-            status_callback(f"  - Translated chunk {idx} saved to GCS.")
+        Gemini calls and agent validations are bounded by separate semaphores,
+        so a chunk can be validated while others are still being translated.
 
-            # Step 2: Validate with Agent
-            if self.config.use_agent_validation:
-                status_callback(f"  - Validating translated chunk {idx} with ADK Agent...")
-                try:
-                  
-                     # Use GCS URIs directly.
-                    # This assumes the agent's service account has GCS read access.
-                    prompt_url = f"gs://{self.config.gcs_bucket}/{prompt_blob.name}"
-                    translated_url = f"gs://{self.config.gcs_bucket}/{translated_blob_path}"
-                    print ("prompt URL:" + prompt_url)
-                    print ("translated URL:" +translated_url)
-                    # Call validation agent
-                    validation_result = validate_translation_with_agent(
-                        prompt_url,
-                        translated_url
-                    )
-                    self.logger.info(f"Validation result for chunk {idx}: {validation_result['output'][:100]}...")
-                    # The agent's output is the final, validated translation.
-                    # The agent is instructed to save the final validated content to a specific GCS path.
-                    # We need to read that content from GCS, not use the agent's chat response directly.
-                    agent_saved_filename = os.path.basename(prompt_blob.name).replace(
-                        'translation_prompt_',
-                        'final_translated_',
-                    )
-                    agent_saved_gcs_path = f"{translated_folder}{agent_saved_filename}"
+        Args:
+            status_callback: Callback for progress updates
+        """
+        gemini_slots = asyncio.Semaphore(translation_config.Concurrency.GEMINI_MAX_CONCURRENT)
+        validation_slots = asyncio.Semaphore(translation_config.Concurrency.VALIDATION_MAX_WORKERS)
 
-                    # Read the actual validated content that the agent saved to GCS.
-                    #final_content = self.gcs.read_blob_text(agent_saved_gcs_path)
+        self._generations = {}
+        keep_alive = asyncio.create_task(self._keep_context_cache_alive()) if self._context_cache else None
+        try:
+            await asyncio.gather(*(
+                self._process_chunk(
+                    index, len(self._chunk_indices),
+                    gemini_slots, validation_slots, status_callback
+                )
+                for index in self._chunk_indices
+            ))
+        finally:
+            if keep_alive:
+                keep_alive.cancel()
+            self._generations = {}
+
+    async def _run_io(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking GCS or cache call on the I/O thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_executor, functools.partial(func, *args, **kwargs))
+
+    async def _keep_context_cache_alive(self) -> None:
+        """Extend the context cache's TTL periodically until cancelled or the cache is dropped."""
+        while True:
+            await asyncio.sleep(translation_config.GeminiLimits.CONTEXT_CACHE_REFRESH_SECONDS)
+            cache_name = self._context_cache
+            if not cache_name:
+                return
+            try:
+                await self._run_io(self.gemini.extend_context_cache, cache_name)
+            except Exception as e:
+                # A failed refresh is not fatal: _generate falls back to full prompts
+                self.logger.warning(f"Failed to extend Gemini context cache: {e}")
+
+    async def _generate(self, prompt: str) -> str:
+        """
+        Generate a response, sending only the chunk part when the preamble is cached.
 
-                    status_callback(
-                        f"  - Validation complete for chunk {idx}. "
-                        f"Final version retrieved from GCS: {agent_saved_gcs_path}"
+        If a request against the context cache is rejected (e.g. the cache has
+        expired), the cache is dropped for the rest of the job and the full
+        prompt is sent instead.
+        """
+        preamble = self._prompt_preamble
+        cache_name = self._context_cache
+        if cache_name and preamble and prompt.startswith(preamble):
+            try:
+                return await self.gemini.generate_async(
+                    prompt[len(preamble):],
+                    self.config.temperature,
+                    cached_content=cache_name
+                )
+            except errors.ClientError as e:
+                if e.code == 429:
+                    raise
+                if self._context_cache == cache_name:
+                    self.logger.warning(
+                        f"Gemini context cache {cache_name} rejected ({e.code}); sending full prompts"
                     )
+                    self._context_cache = None
+        return await self.gemini.generate_async(prompt, self.config.temperature)
 
-                except Exception as e:
-                    # Log validation errors but don't fail the pipeline
-                    error_type = type(e).__name__
-                    self.logger.warning(f"Validation failed for chunk {idx} ({error_type}): {e}", exc_info=True)
-                    status_callback(
-                        f"  - Warning: Validation failed for chunk {idx} "
-                        f"({error_type}): {str(e)}"
-                    )
-                    # If validation fails, use the original translated content as a fallback.
-                    final_content = translated
-                    # And ensure this fallback content is saved to the expected final path.
-                    final_blob_path_for_fallback = f"{translated_folder}{os.path.basename(prompt_blob.name).replace('translation_prompt_', 'final_translated_',)}"
-                    self.gcs.upload(
-                        blob_path=final_blob_path_for_fallback,
-                        content=final_content
-                    )
-            else:
-                # If validation is skipped, the 'translated' content is the 'final' content.
-                status_callback(f"  - Skipping agent validation for chunk {idx}.")
-                final_blob_path = f"{translated_folder}{os.path.basename(prompt_blob.name).replace('translation_prompt_', 'final_translated_',)}"
-                self.gcs.upload(blob_path=final_blob_path, content=translated)
+    async def _generate_cached(self, prompt: str) -> str:
+        """
+        Generate a response, reusing one for an identical request.
+
+        Identical prompts within a run (repeated chunks) share a single
+        request; across runs, responses are reused from the GCS cache.
+        Cache failures are logged and never fail the translation.
+
+        Args:
+            prompt: Input prompt text for generation
+
+        Returns:
+            Generated text response
+        """
+        key = GeminiCache.key(self.gemini.model, self.config.temperature, prompt)
+        generation = self._generations.get(key)
+        if generation is None:
+            generation = self._generations[key] = asyncio.create_task(
+                self._generate_persisted(key, prompt)
+            )
+        else:
+            self.logger.info(f"Reusing in-flight Gemini response {key[:12]}")
+        return await generation
+
+    async def _generate_persisted(self, key: str, prompt: str) -> str:
+        """Generate a response through the GCS cache, if enabled."""
+        if self.llm_cache is None:
+            return await self._generate(prompt)
 
-        return len(prompt_blobs)
+        try:
+            cached = await self._run_io(self.llm_cache.lookup, key)
+        except Exception as e:
+            self.logger.warning(f"Gemini cache lookup failed: {e}")
+            cached = None
+        if cached is not None:
+            self.logger.info(f"Using cached Gemini response {key[:12]}")
+            return cached
+
+        response = await self._generate(prompt)
+        if response:
+            try:
+                await self._run_io(self.llm_cache.update, key, response)
+            except Exception as e:
+                self.logger.warning(f"Gemini cache update failed: {e}")
+        return response
+
+    async def _try_validation_cache(
+        self,
+        operation: Callable[[str, str], Optional[bool]],
+        key: str,
+        blob_path: str
+    ) -> bool:
+        """
+        Run a validation cache operation off the event loop.
+
+        Cache failures are logged and never fail the translation.
+
+        Returns:
+            The operation's result, or False if it failed
+        """
+        try:
+            return bool(await self._run_io(operation, key, blob_path))
+        except Exception as e:
+            self.logger.warning(f"Validation cache {operation.__name__} failed: {e}")
+            return False
+
+    async def _process_chunk(
+        self,
+        idx: int,
+        total: int,
+        gemini_slots: asyncio.Semaphore,
+        validation_slots: asyncio.Semaphore,
+        status_callback: Callable[[str], None]
+    ) -> None:
+        """Translate, upload and validate a single chunk."""
+        prompt_blob_path = f"{self._prompts_folder}/{self.PROMPT_BLOB_NAME.format(idx)}"
+        translated_blob_path = f"{self._translated_folder}/{self.TRANSLATED_BLOB_NAME.format(idx)}"
+        final_blob_path = f"{self._translated_folder}/{self.FINAL_BLOB_NAME.format(idx)}"
+
+        passthrough = self._passthrough_chunks.get(idx)
+        if passthrough is not None:
+            # Only placeholders and numbers: the translation is the source itself
+            status_callback(f"  - Chunk {idx} has no translatable text; skipping translation.")
+            await asyncio.gather(
+                self._run_io(
+                    self.gcs.upload, blob_path=translated_blob_path, content=passthrough, compress=True
+                ),
+                self._run_io(self.gcs.upload, blob_path=final_blob_path, content=passthrough),
+            )
+            return
+
+        # Step 1: Translate; the prompt is fetched before taking a Gemini slot
+        prompt_content = await self._run_io(self.gcs.read_blob_text, prompt_blob_path)
+        async with gemini_slots:
+            translated = await self._generate_cached(prompt_content)
+        status_callback(f"  - Translated chunk {idx}/{total}.")
+
+        await self._run_io(
+            self.gcs.upload, blob_path=translated_blob_path, content=translated, compress=True
+        )
+        status_callback(f"  - Translated chunk {idx} saved to GCS.")
+
+        if not self.config.use_agent_validation:
+            # If validation is skipped, the 'translated' content is the 'final' content.
+            status_callback(f"  - Skipping agent validation for chunk {idx}.")
+            await self._run_io(self.gcs.upload, blob_path=final_blob_path, content=translated)
+            return
+
+        # Step 2: Validate with Agent
+        status_callback(f"  - Validating translated chunk {idx} with ADK Agent...")
+        # Use GCS URIs directly.
+        # This assumes the agent's service account has GCS read access.
+        prompt_url = f"gs://{self.config.gcs_bucket}/{prompt_blob_path}"
+        translated_url = f"gs://{self.config.gcs_bucket}/{translated_blob_path}"
+        self.logger.debug(f"Validating chunk {idx}: prompt {prompt_url}, translation {translated_url}")
+
+        validation_key = None
+        if self.validation_cache is not None:
+            validation_key = ValidationCache.key(prompt_content, translated)
+            if await self._try_validation_cache(self.validation_cache.restore, validation_key, final_blob_path):
+                status_callback(f"  - Reused cached validation for chunk {idx}: {final_blob_path}")
+                return
+
+        try:
+            async with validation_slots:
+                validation_result = await asyncio.get_running_loop().run_in_executor(
+                    self._validation_executor, validate_translation_with_agent, prompt_url, translated_url
+                )
+            self.logger.info(f"Validation result for chunk {idx}: {validation_result['output'][:100]}...")
+            # The agent is instructed to save the final validated content to
+            # final_blob_path, so its chat response is not used directly.
+            status_callback(
+                f"  - Validation complete for chunk {idx}. "
+                f"Final version retrieved from GCS: {final_blob_path}"
+            )
+            if validation_key is not None:
+                await self._try_validation_cache(self.validation_cache.store, validation_key, final_blob_path)
+
+        except Exception as e:
+            # Log validation errors but don't fail the pipeline
+            error_type = type(e).__name__
+            self.logger.warning(f"Validation failed for chunk {idx} ({error_type}): {e}", exc_info=True)
+            status_callback(
+                f"  - Warning: Validation failed for chunk {idx} "
+                f"({error_type}): {str(e)}"
+            )
+            # If validation fails, use the original translated content as a
+            # fallback, saved to the expected final path.
+            await self._run_io(self.gcs.upload, blob_path=final_blob_path, content=translated)
 
     def _reassemble_final_document(
         self,
@@ -1201,9 +2068,9 @@ class TranslationPipeline:
         """
         Reassembles the final translated document from validated chunks.
 
-        Downloads all `final_translated_chunk_*.txt` files, concatenates
-        them in order, and saves the result as a single file in the root
-        of the session folder.
+        Concatenates all `final_translated_chunk_*.txt` files in order with
+        a server-side compose, so no chunk passes through this process, and
+        saves the result as a single file in the root of the session folder.
 
         Args:
             original_file_type: The file type of the original document (e.g., 'po', 'txt')
@@ -1211,36 +2078,41 @@ class TranslationPipeline:
 
         Returns:
             The GCS URI of the final assembled document.
-        """
-        chunks_folder = f"{self.config.gcs_folder.strip('/')}/translated_chunks/"
-        final_chunk_prefix = f"{chunks_folder}final_translated_chunk_"
 
-        status_callback("  - Listing final translated chunks from GCS...")
-        final_blobs = self.gcs.list_blobs(final_chunk_prefix)
+        Raises:
+            IOError: If any chunk's final file is missing, since composing
+                without it would leave a hole in the translation
+        """
+        # Final chunk names follow from the chunk indices, in document order;
+        # every chunk writes one, falling back to its unvalidated translation
+        status_callback("  - Checking final translated chunks in GCS...")
+        final_paths = [
+            f"{self._translated_folder}/{self.FINAL_BLOB_NAME.format(index)}"
+            for index in self._chunk_indices
+        ]
+        exists = self.gcs.batch_exists(final_paths)
+        missing = [
+            index for index, path in zip(self._chunk_indices, final_paths)
+            if not exists[path]
+        ]
+        if missing:
+            status_callback(f"  - Final translated chunks missing from GCS: {missing}")
+            raise IOError(f"Cannot assemble the final document, chunks {missing} are missing")
+        final_blobs = [self.gcs.bucket.blob(path) for path in final_paths]
 
         if not final_blobs:
             status_callback("  - No final translated chunks found to assemble.")
             return "No final document created."
 
-        # Sort blobs numerically to ensure correct order
-        final_blobs = sorted(final_blobs, key=lambda b: b.name)
         status_callback(f"  - Found {len(final_blobs)} chunks to assemble.")
 
-        # Concatenate content
-        full_content_parts = []
-        for blob in final_blobs:
-            status_callback(f"  - Downloading {os.path.basename(blob.name)}...")
-            full_content_parts.append(blob.download_as_text())
-
-        final_content = "".join(full_content_parts)
-
-        # Save the final assembled file
+        # Concatenate the chunks into the final assembled file
         original_basename = os.path.basename(self.config.source_file)
         final_filename = f"FINAL_{original_basename}"
-        final_doc_path = f"{self.config.gcs_folder.strip('/')}/{final_filename}"
+        final_doc_path = f"{self._folder}/{final_filename}"
 
-        status_callback(f"  - Uploading final assembled document to GCS...")
-        final_gcs_uri = self.gcs.upload(blob_path=final_doc_path, content=final_content)
+        status_callback("  - Composing final assembled document in GCS...")
+        final_gcs_uri = self.gcs.compose(final_blobs, final_doc_path)
 
         return final_gcs_uri
 
@@ -1249,6 +2121,44 @@ class TranslationPipeline:
 # UTILITY FUNCTIONS
 # ============================================================================
 
+def _download_utf8(blob: storage.Blob) -> str:
+    """
+    Download a blob and decode it as UTF-8.
+
+    All text artifacts in the session folder are written as UTF-8, so the
+    charset lookup that `download_as_text` performs is skipped.
+
+    Args:
+        blob: Blob to download
+
+    Returns:
+        The blob content as a string
+    """
+    return blob.download_as_bytes().decode('utf-8')
+
+
+# Types the mimetypes database lacks or that should not depend on the host
+_CONTENT_TYPE_OVERRIDES = {
+    '.po': 'text/x-gettext-translation',
+    '.txt': 'text/plain',
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_content_type(suffix: str) -> str:
+    """
+    Return the content type for a lowercase file extension such as '.epub'.
+
+    Args:
+        suffix: File extension including the leading dot
+
+    Returns:
+        The content type, or 'application/octet-stream' if unknown
+    """
+    if suffix in _CONTENT_TYPE_OVERRIDES:
+        return _CONTENT_TYPE_OVERRIDES[suffix]
+    content_type, _ = mimetypes.guess_type(f"file{suffix}")
+    return content_type or 'application/octet-stream'
 
 
 
@@ -1278,7 +2188,7 @@ def main() -> None:
     logger.info("Translation solution with AI Validation")
     logger.info("=" * 70)
 
-    gcs_folder = f"{args.gcs_folder_prefix.strip('/')}/{str(uuid.uuid4()).replace('-', '')}"
+    gcs_folder = f"{args.gcs_folder_prefix.strip('/')}/{uuid.uuid4().hex}"
 
     job_cofig = TranslationConfig(
         source_file=args.source_file,
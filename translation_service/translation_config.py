@@ -34,14 +34,58 @@ class Session:
     VALIDATION_USER_ID_BYTES = 8
 
 
+class Concurrency:
+    """Concurrency limits for network-bound work."""
+    VALIDATION_MAX_WORKERS = 8
+    UPLOAD_MAX_WORKERS = 16
+    # Concurrent Gemini generations; bounded by the project's quota.
+    GEMINI_MAX_CONCURRENT = 8
+    # Concurrent downloads: threads for many small blobs, processes for
+    # chunked downloads of one large object.
+    DOWNLOAD_MAX_WORKERS = 16
+
+
 class GeminiLimits:
     """API limits for Gemini."""
     MAX_OUTPUT_TOKENS = 8192
+    # Retries for rate-limit (429) and server (5xx) errors, with exponential backoff.
+    MAX_RETRIES = 5
+    RETRY_BASE_DELAY_SECONDS = 2.0
+    # Lifetime of the per-job context cache holding the shared prompt preamble;
+    # it is extended every CONTEXT_CACHE_REFRESH_SECONDS while the job runs.
+    CONTEXT_CACHE_TTL_SECONDS = 3600
+    CONTEXT_CACHE_REFRESH_SECONDS = 1200
+
+
+class LLMCache:
+    """Constants for the GCS-backed caches of Gemini responses and validations."""
+    PREFIX = "_llm_cache"
+    VALIDATION_PREFIX = "_validation_cache"
+    TTL_SECONDS = 7 * 24 * 60 * 60
 
 
 class GCSConstants:
     """Constants for Google Cloud Storage interactions."""
     SIGNED_URL_EXPIRATION_MINUTES = 15
+    # Cached signed URLs are handed out for this fraction of their lifetime.
+    SIGNED_URL_REUSE_FRACTION = 0.8
+    # Resumable upload request size; must be a multiple of 256 KiB.
+    UPLOAD_CHUNK_SIZE_BYTES = 15 * 1024 * 1024
+    # Objects larger than this are downloaded as concurrent range requests.
+    PARALLEL_DOWNLOAD_THRESHOLD_BYTES = 64 * 1024 * 1024
+    DOWNLOAD_CHUNK_SIZE_BYTES = 32 * 1024 * 1024
+    # Compression level for gzip-encoded intermediate artifacts.
+    GZIP_COMPRESS_LEVEL = 6
+    # Smaller payloads gain too little from gzip to be worth encoding.
+    GZIP_MIN_BYTES = 4096
+    # Largest page the JSON API returns for object listings.
+    LIST_PAGE_SIZE = 1000
+    # Maximum number of sub-requests the batch endpoint accepts per call.
+    BATCH_MAX_REQUESTS = 100
+    # Maximum number of source objects in one compose request.
+    COMPOSE_MAX_SOURCES = 32
+    # HTTP connections kept per host; at least Concurrency.UPLOAD_MAX_WORKERS.
+    HTTP_POOL_SIZE = 32
 
 
 class FileTypes:
@@ -0,0 +1,61 @@
+"""
+Structured text edits emitted by the validators and applied by the editor.
+"""
+import logging
+from typing import Iterable, List, Mapping, Tuple
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class TextEdit(BaseModel):
+    """A single verbatim substitution in the translated text."""
+    find: str = Field(
+        description="Verbatim substring of the translated text, with enough surrounding "
+                    "context that it occurs exactly once."
+    )
+    replace: str = Field(description="Text that replaces `find`, including the same surrounding context.")
+
+
+class SuggestedEdits(BaseModel):
+    """Validator output: the edits to apply, empty when no issues were found."""
+    edits: List[TextEdit] = Field(default_factory=list)
+
+
+def apply_edits(text: str, edits: Iterable[Mapping[str, str]]) -> str:
+    """
+    Applies find/replace edits to a text.
+
+    Every edit is located in the original text, so an edit never rewrites
+    text produced by another one. Edits whose `find` is empty, missing,
+    ambiguous (occurs more than once) or overlaps an earlier accepted edit
+    are skipped.
+
+    Args:
+        text: The translated text to correct.
+        edits: Edits as `{"find": ..., "replace": ...}` mappings.
+
+    Returns:
+        The corrected text.
+    """
+    accepted: List[Tuple[int, int, str]] = []
+    for edit in edits:
+        find = edit.get("find") or ""
+        start = text.find(find) if find else -1
+        if start < 0:
+            logger.warning(f"Skipping edit that does not match the text: {find!r}")
+            continue
+        if text.find(find, start + 1) >= 0:
+            logger.warning(f"Skipping ambiguous edit that matches more than once: {find!r}")
+            continue
+        end = start + len(find)
+        if any(start < other_end and other_start < end for other_start, other_end, _ in accepted):
+            logger.warning(f"Skipping edit that overlaps another edit: {find!r}")
+            continue
+        accepted.append((start, end, edit.get("replace") or ""))
+
+    # Splice from the end so earlier offsets stay valid
+    for start, end, replace in sorted(accepted, reverse=True):
+        text = text[:start] + replace + text[end:]
+    return text
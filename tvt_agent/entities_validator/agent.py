@@ -1,12 +1,14 @@
 from google.adk.agents import Agent
 from tvt_agent.prompts import ENTITY_VALIDATOR_INSTRUCTION
+from tvt_agent.edits import SuggestedEdits
 
 entity_validator= Agent(
     model='gemini-2.5-flash',
     name='entity_validator',
     description='An agent that validates named entities in a translated text.',
     instruction=ENTITY_VALIDATOR_INSTRUCTION,
-        output_key="suggested_entity_edits" 
+    output_schema=SuggestedEdits,
+    output_key="suggested_entity_edits"
 )
 
 root_agent = entity_validator
\ No newline at end of file
@@ -1,5 +1,7 @@
 from google.cloud import storage
 from google.api_core import exceptions
+from google.adk.tools import ToolContext
+import asyncio
 import re
 import logging
 from typing import Optional
@@ -7,6 +9,12 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 storage_client = storage.Client()
 
+# Resumable upload request size; must be a multiple of 256 KiB.
+UPLOAD_CHUNK_SIZE = 15 * 1024 * 1024
+
+# Splits "gs://bucket/path/to/blob" into (bucket, blob path)
+_GCS_URI_RE = re.compile(r"gs://([^/]+)/(.+)")
+
 
 def read_file_from_gcs(gcs_uri: str) -> Optional[str]:
     """
@@ -19,7 +27,7 @@ def read_file_from_gcs(gcs_uri: str) -> Optional[str]:
         The content of the file as a string, or None if the file does not exist.
     """
     logger.info(f"Reading file from GCS: {gcs_uri}")
-    match = re.match(r"gs://([^/]+)/(.+)", gcs_uri)
+    match = _GCS_URI_RE.match(gcs_uri)
     if not match:
         raise ValueError(f"Invalid GCS URI: {gcs_uri}")
 
@@ -37,6 +45,46 @@ def read_file_from_gcs(gcs_uri: str) -> Optional[str]:
         logger.error(f"Error reading file from GCS: {e}", exc_info=True)
         raise
 
+async def aread_file_from_gcs(gcs_uri: str) -> Optional[str]:
+    """
+    Async variant of `read_file_from_gcs`, run in a worker thread so the
+    event loop keeps serving other sessions during the download.
+    """
+    return await asyncio.to_thread(read_file_from_gcs, gcs_uri)
+
+async def load_validation_inputs(
+    translated_file_uri: str,
+    original_prompt_file_uri: str,
+    tool_context: ToolContext,
+) -> dict:
+    """
+    Reads the translated file and its original prompt file from GCS.
+
+    Both contents and the translated file's URI are also stored in the session
+    state, where the editor step reads them to apply the validators' edits.
+
+    Args:
+        translated_file_uri: The GCS URI of the translated file.
+        original_prompt_file_uri: The GCS URI of the original prompt file.
+        tool_context: Injected by ADK; gives access to the session state.
+
+    Returns:
+        A dict with the `translated_text` and `original_prompt` contents.
+    """
+    translated_text, original_prompt = await asyncio.gather(
+        aread_file_from_gcs(translated_file_uri),
+        aread_file_from_gcs(original_prompt_file_uri),
+    )
+    if translated_text is None or original_prompt is None:
+        raise FileNotFoundError(
+            f"Missing validation input: {translated_file_uri}, {original_prompt_file_uri}"
+        )
+
+    tool_context.state["translated_uri"] = translated_file_uri
+    tool_context.state["translated_text"] = translated_text
+    tool_context.state["original_prompt"] = original_prompt
+    return {"translated_text": translated_text, "original_prompt": original_prompt}
+
 def save_file_to_gcs(gcs_uri: str, content: str) -> str:
     """
     Saves content to a file in Google Cloud Storage.
@@ -48,7 +96,7 @@ def save_file_to_gcs(gcs_uri: str, content: str) -> str:
     Returns:
         A confirmation message indicating the file was saved.
     """
-    match = re.match(r"gs://([^/]+)/(.+)", gcs_uri)
+    match = _GCS_URI_RE.match(gcs_uri)
     if not match:
         raise ValueError(f"Invalid GCS URI: {gcs_uri}")
     bucket_name, blob_name = match.groups()
@@ -56,13 +104,20 @@ def save_file_to_gcs(gcs_uri: str, content: str) -> str:
     logger.info(f"Saving file to GCS: {gcs_uri}")
     try:
         bucket = storage_client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
+        blob = bucket.blob(blob_name, chunk_size=UPLOAD_CHUNK_SIZE)
         blob.upload_from_string(content, content_type='text/plain')
         return f"Successfully saved content to {gcs_uri}"
     except Exception as e:
         logger.error(f"Error saving file to GCS: {e}", exc_info=True)
         raise
 
+async def asave_file_to_gcs(gcs_uri: str, content: str) -> str:
+    """
+    Async variant of `save_file_to_gcs`, run in a worker thread so the
+    event loop keeps serving other sessions during the upload.
+    """
+    return await asyncio.to_thread(save_file_to_gcs, gcs_uri, content)
+
 def create_final_gcs_uri(original_gcs_uri: str) -> str:
     """
     Creates a new GCS URI for the final validated file.
@@ -80,6 +135,5 @@ def create_final_gcs_uri(original_gcs_uri: str) -> str:
     if '/' not in original_gcs_uri:
         raise ValueError(f"Invalid GCS URI format: {original_gcs_uri}")
 
-    path_prefix = original_gcs_uri.rsplit('/', 1)[0]
-    original_filename = original_gcs_uri.rsplit('/', 1)[1]
+    path_prefix, _, original_filename = original_gcs_uri.rpartition('/')
     return f"{path_prefix}/final_{original_filename}"
\ No newline at end of file
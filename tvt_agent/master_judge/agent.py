@@ -1,24 +1,67 @@
-from google.adk.agents import LlmAgent, SequentialAgent
+from typing import AsyncGenerator, Optional
+
+from google.adk.agents import BaseAgent, SequentialAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.genai import types
 from tvt_agent.entities_validator.agent import entity_validator
 from tvt_agent.style_validator.agent import style_validator
-from tvt_agent.prompts import EDITOR_AGENT_INSTRUCTION
-from tvt_agent.gcs_utils import save_file_to_gcs,create_final_gcs_uri
+from tvt_agent.edits import apply_edits
+from tvt_agent.gcs_utils import asave_file_to_gcs, create_final_gcs_uri
+
+
+class EditorAgent(BaseAgent):
+    """
+    Applies the validators' suggested edits to the translated text and saves
+    the result next to it with a "final_" prefix.
+
+    The edits are verbatim substitutions, so they are applied in Python
+    rather than by another model call.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        if "translated_text" not in state or "translated_uri" not in state:
+            yield self._event(
+                ctx,
+                "Cannot apply edits: the validation inputs were not loaded. "
+                "Call load_validation_inputs first.",
+                error_code="MISSING_VALIDATION_INPUTS",
+            )
+            return
+
+        edits = [
+            *(state.get("suggested_entity_edits") or {}).get("edits", []),
+            *(state.get("suggested_style_edits") or {}).get("edits", []),
+        ]
+        corrected = apply_edits(state["translated_text"], edits)
 
+        final_uri = create_final_gcs_uri(state["translated_uri"])
+        await asave_file_to_gcs(final_uri, corrected)
 
-editor_agent=LlmAgent(
-    model='gemini-2.5-flash',
+        yield self._event(ctx, f"Applied edits from {len(edits)} suggestions. Final file: {final_uri}")
+
+    def _event(self, ctx: InvocationContext, text: str, error_code: Optional[str] = None) -> Event:
+        return Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+            error_code=error_code,
+            error_message=text if error_code else None,
+        )
+
+
+editor_agent = EditorAgent(
     name='editor_agent',
-    description="""An agent that makes final edits to the validated translation to ensure clarity and coherence.""",
-    instruction=EDITOR_AGENT_INSTRUCTION,
-    tools=[save_file_to_gcs,create_final_gcs_uri],
+    description="""Applies the suggested entity and style edits to the translation and saves the final file.""",
 )
 
 master_judge = SequentialAgent(
     name='master_judge',
     description='A master judge orchestrating multiple validation agents to ensure the quality of a translated document.',
     sub_agents=[entity_validator, style_validator, editor_agent],
-   
+
 )
 
 root_agent = master_judge
-
@@ -1,12 +1,14 @@
 from google.adk.agents.llm_agent import Agent
 from tvt_agent.prompts import STYLE_VALIDATOR_INSTRUCTION
+from tvt_agent.edits import SuggestedEdits
 
 style_validator = Agent(
     model='gemini-2.5-pro',
     name='style_validator',
     description='An agent that validates the style and tone of a translated text.',
     instruction=STYLE_VALIDATOR_INSTRUCTION,
-    output_key="suggested_style_edits" 
+    output_schema=SuggestedEdits,
+    output_key="suggested_style_edits"
 )
 
 root_agent = style_validator
\ No newline at end of file